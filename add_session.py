@@ -14,6 +14,7 @@ from datetime import datetime
 sys.path.insert(0, str(Path(__file__).parent))
 
 from utils.club_manager import ClubManager
+from utils.data_processor import GolfDataProcessor
 
 
 def add_session(
@@ -118,6 +119,12 @@ def add_session(
             if notes:
                 print(f"   📝 Notes: {notes}")
     
+    # Parse once now so the dashboard loads this session from the Parquet cache
+    try:
+        GolfDataProcessor(data_dir=str(data_dir)).cache_session(dest)
+    except Exception as e:
+        print(f"⚠️  Could not pre-process session (it will be parsed on next load): {e}")
+    
     print(f"\n💡 Restart the dashboard to load this session:")
     print(f"   marimo edit dashboard.py")
 
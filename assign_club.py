@@ -47,38 +47,29 @@ def print_club_list(club_manager: ClubManager):
     print("-" * 50)
 
 
-def suggest_club(avg_carry: float, club_manager: ClubManager) -> str:
-    """Suggest a club based on average carry distance"""
-    best_match = None
-    min_diff = float('inf')
-    
-    for club_name, specs in club_manager.STANDARD_CLUBS.items():
-        diff = abs(specs['typical_carry'] - avg_carry)
-        if diff < min_diff:
-            min_diff = diff
-            best_match = club_name
-    
-    return best_match
-
-
 def assign_session(
     session_id: str,
     session_date: str,
     avg_carry: float,
-    club_manager: ClubManager
+    club_manager: ClubManager,
+    suggestion: tuple = None
 ) -> tuple:
     """
     Prompt user to assign a club to a session
     
+    Args:
+        suggestion: (club, confidence) suggested from the session's carry, if any
+    
     Returns:
         (club, notes) tuple
     """
     print(f"\n📅 Session: {session_date} ({session_id})")
     
     if avg_carry:
-        suggestion = suggest_club(avg_carry, club_manager)
         print(f"   Average carry: {avg_carry:.1f} yards")
-        print(f"   💡 Suggested club: {suggestion}")
+    if suggestion:
+        club, confidence = suggestion
+        print(f"   💡 Suggested club: {club} ({confidence:.0%} confidence)")
     
     # Get club input
     while True:
@@ -159,6 +150,13 @@ def main():
     # Show club list
     print_club_list(club_manager)
     
+    # Suggest clubs for all unassigned sessions in one batch
+    suggestions = {
+        session_id: (club, confidence) for session_id, club, confidence in club_manager.suggest_clubs(
+            summary.filter(pl.col('session_id').is_in([s['session_id'] for s in unassigned]))
+        ).select(['session_id', 'suggested_club', 'confidence']).iter_rows()
+    }
+    
     # Process each unassigned session
     assigned_this_session = 0
     
@@ -167,7 +165,9 @@ def main():
         date_str = session_data['session_date'].strftime('%Y-%m-%d')
         avg_carry = session_data.get('median_carry')
         
-        club, notes = assign_session(session_id, date_str, avg_carry, club_manager)
+        club, notes = assign_session(
+            session_id, date_str, avg_carry, club_manager, suggestions.get(session_id)
+        )
         
         if club is None:  # User wants to quit
             print(f"\n👋 Assigned {assigned_this_session} sessions this session. Exiting.")
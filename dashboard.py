@@ -13,6 +13,7 @@ app = marimo.App(width="full")
 def _():
     import marimo as mo
     import polars as pl
+    import plotly.graph_objects as go
     from pathlib import Path
     import sys
 
@@ -23,7 +24,7 @@ def _():
     from utils.visualizations import GolfVisualizer, COLORS
     from utils.club_manager import ClubManager
 
-    return GolfDataProcessor, GolfVisualizer, mo, pl
+    return GolfDataProcessor, GolfVisualizer, go, mo, pl
 
 
 @app.cell
@@ -101,8 +102,8 @@ def _(
 
 
 @app.cell
-def _(GolfDataProcessor, GolfVisualizer, goals, mo):
-    """Load and Process Data"""
+def _(GolfDataProcessor, mo):
+    """Load and Process Data (independent of goals, so sliders never reload)"""
     mo.md("## 📊 Loading Session Data...")
 
     try:
@@ -117,9 +118,6 @@ def _(GolfDataProcessor, GolfVisualizer, goals, mo):
         all_clubs = processor.get_all_clubs()
         missing_clubs = processor.get_sessions_without_clubs()
 
-        # Initialize visualizer with goals
-        viz = GolfVisualizer(goals=goals)
-
         status_msg = f"✅ **Loaded {summary.height} sessions** | Latest: `{latest_session}`"
         if missing_clubs:
             status_msg += f"\n\n⚠️ **{len(missing_clubs)} sessions missing club assignment** - Use `python manage_clubs.py assign <session_id> <club>` to add"
@@ -131,7 +129,14 @@ def _(GolfDataProcessor, GolfVisualizer, goals, mo):
         mo.md("Place your session CSV files in the `data/` directory with format: `session_YYYY_MM_DD.csv`")
         raise
 
-    return all_clubs, latest_session, processor, summary, viz
+    return all_clubs, processor, summary
+
+
+@app.cell
+def _(GolfVisualizer):
+    """Initialize visualizer (goals are drawn as overlays, so slider changes never rebuild charts)"""
+    viz = GolfVisualizer()
+    return (viz,)
 
 
 @app.cell
@@ -181,11 +186,26 @@ def _(club_selector):
 
 
 @app.cell
-def _(processor, selected_club):
-    """Display data preview"""
-    summary_filtered = processor.get_session_summary(club=selected_club)
+def _(all_clubs, processor, selected_club):
+    """Dashboard Data (one batched query pass per club filter)"""
+    queries = {
+        'summary_filtered': ('get_session_summary', {'club': selected_club}),
+        'carry_trend': ('calculate_trend', {'metric': 'carry_std', 'window': 3, 'club': selected_club}),
+        'quality_trend': ('calculate_trend', {'metric': 'quality_score', 'window': 3, 'club': selected_club}),
+        'shots': ('get_shot_distribution', {'club': selected_club}),
+    }
+    if all_clubs:
+        queries['club_comparison'] = ('get_club_comparison', {})
+
+    dashboard_data = processor.collect_all(queries)
+    summary_filtered = dashboard_data['summary_filtered']
+    carry_trend = dashboard_data['carry_trend']
+    quality_trend = dashboard_data['quality_trend']
+    shots = dashboard_data['shots']
+    club_comparison = dashboard_data.get('club_comparison')
+
     summary_filtered.head()
-    return (summary_filtered,)
+    return carry_trend, club_comparison, quality_trend, shots, summary_filtered
 
 
 @app.cell
@@ -203,28 +223,48 @@ def _(mo):
 
 
 @app.cell
-def _(latest_session, pl, summary_filtered, viz):
-    """Summary Comparison Table"""
-    current_stats = summary_filtered.filter(summary_filtered['session_id'] == latest_session)
+def _(mo, pl, processor, selected_club, summary_filtered):
+    """Current vs Historical Stats"""
+    mo.stop(summary_filtered.height == 0, mo.md("⚠️ No sessions with valid shots for this club yet."))
+
+    # Latest session of the selected club (of any club for All Clubs)
+    current_session = summary_filtered.sort('session_date')['session_id'][-1]
+    current_stats = summary_filtered.filter(pl.col('session_id') == current_session)
+
+    # Precomputed average of all earlier sessions (of the selected club)
+    historical_stats = processor.get_session_baseline(
+        current_session,
+        scope='club' if selected_club else 'all'
+    )
+    return current_session, current_stats, historical_stats
 
-    # Calculate historical average (excluding current)
-    historical_stats = summary_filtered.filter(summary_filtered['session_id'] != latest_session).select([
-        summary_filtered.select(pl.selectors.by_dtype(pl.Float64)).mean(),
-    ])
 
-    table_fig = viz.create_summary_table(current_stats, historical_stats)
+@app.cell
+def _(current_stats, goals, historical_stats, viz):
+    """Summary Comparison Table"""
+    table_fig = viz.create_summary_table(current_stats, historical_stats, goals)
     table_fig
-    return current_stats, historical_stats
+    return
 
 
 @app.cell
 def _(current_stats, historical_stats, viz):
-    """Performance Radar Chart"""
-    radar_fig = viz.plot_performance_radar(
+    """Performance Radar Chart - Data"""
+    radar_base = viz.plot_performance_radar(
         current_stats, 
         historical_stats,
-        metrics=['strike_quality_rate', 'optimal_launch_rate', 'quality_score', 'straight_rate']
+        metrics=['strike_quality_rate', 'optimal_launch_rate', 'quality_score', 'straight_rate'],
+        with_goals=False
     )
+    return (radar_base,)
+
+
+@app.cell
+def _(go, goals, radar_base, viz):
+    """Performance Radar Chart - Goal Overlay"""
+    # Overlays go on a copy so the data cell's figure stays goal-free; the
+    # data traces are reused, but the whole figure is re-sent on each change
+    radar_fig = viz.apply_goals(go.Figure(radar_base), goals)
     radar_fig
     return
 
@@ -244,9 +284,9 @@ def _(mo):
 
 
 @app.cell
-def _(latest_session, summary_filtered, viz):
+def _(current_session, summary_filtered, viz):
     """Consistency Dashboard - Small Multiples"""
-    consistency_fig = viz.plot_consistency_dashboard(summary_filtered, latest_session)
+    consistency_fig = viz.plot_consistency_dashboard(summary_filtered, current_session)
     consistency_fig
     return
 
@@ -266,31 +306,37 @@ def _(mo):
 
 
 @app.cell
-def _(processor, selected_club, viz):
-    """Distance Consistency Trend"""
-    carry_trend = processor.calculate_trend('carry_std', window=3, club=selected_club)
-
-    carry_trend_fig = viz.plot_metric_trend(
+def _(carry_trend, quality_trend, viz):
+    """Trend Charts - Data"""
+    carry_trend_base = viz.plot_metric_trend(
         carry_trend,
         metric='carry_std',
         metric_label='Distance Std Dev (yards)',
-        lower_is_better=True
+        lower_is_better=True,
+        with_goals=False
+    )
+    quality_trend_base = viz.plot_metric_trend(
+        quality_trend,
+        metric='quality_score',
+        metric_label='Composite Quality Score',
+        lower_is_better=False,
+        with_goals=False
     )
+    return carry_trend_base, quality_trend_base
+
+
+@app.cell
+def _(carry_trend_base, go, goals, viz):
+    """Distance Consistency Trend"""
+    carry_trend_fig = viz.apply_goals(go.Figure(carry_trend_base), goals)
     carry_trend_fig
     return
 
 
 @app.cell
-def _(processor, selected_club, viz):
+def _(go, goals, quality_trend_base, viz):
     """Quality Score Trend"""
-    quality_trend = processor.calculate_trend('quality_score', window=3, club=selected_club)
-
-    quality_trend_fig = viz.plot_metric_trend(
-        quality_trend,
-        metric='quality_score',
-        metric_label='Composite Quality Score',
-        lower_is_better=False
-    )
+    quality_trend_fig = viz.apply_goals(go.Figure(quality_trend_base), goals)
     quality_trend_fig
     return
 
@@ -326,22 +372,28 @@ def _(mo):
 
 
 @app.cell
-def _(latest_session, processor, selected_club, session_toggle, viz):
-    """Shot Scatter Plot"""
-    shots = processor.get_shot_distribution(club=selected_club)
-
+def _(current_session, session_toggle, shots, viz):
+    """Shot Scatter Plot - Data"""
     if session_toggle.value == 'current':
-        scatter_fig = viz.plot_shot_scatter(
+        scatter_base = viz.plot_shot_scatter(
             shots,
-            current_session_id=latest_session,
-            title="Shot Dispersion - Current vs Historical"
+            current_session_id=current_session,
+            title="Shot Dispersion - Current vs Historical",
+            with_goals=False
         )
     else:
-        scatter_fig = viz.plot_shot_scatter(
+        scatter_base = viz.plot_shot_scatter(
             shots,
-            title="Shot Dispersion - All Sessions"
+            title="Shot Dispersion - All Sessions",
+            with_goals=False
         )
+    return (scatter_base,)
+
 
+@app.cell
+def _(go, goals, scatter_base, viz):
+    """Shot Scatter Plot - Goal Overlay"""
+    scatter_fig = viz.apply_goals(go.Figure(scatter_base), goals)
     scatter_fig
     return
 
@@ -361,10 +413,9 @@ def _(mo):
 
 
 @app.cell
-def _(all_clubs, mo, processor):
+def _(club_comparison, mo):
     """Club Comparison Table"""
-    if all_clubs:
-        club_comparison = processor.get_club_comparison()
+    if club_comparison is not None:
         club_comparison
     else:
         mo.md("⚠️ No clubs assigned yet. Use `python manage_clubs.py assign <session_id> <club>` to add club metadata.")
@@ -386,11 +437,10 @@ def _(mo):
 
 
 @app.cell
-def _(mo, processor, viz):
+def _(club_comparison, mo, viz):
     """Club Comparison Chart"""
     try:
-        club_comp = processor.get_club_comparison()
-        club_comp_fig = viz.plot_club_comparison(club_comp)
+        club_comp_fig = viz.plot_club_comparison(club_comparison)
         club_comp_fig
     except Exception as e:
         mo.md(f"⚠️ Club comparison unavailable. Assign clubs to sessions to enable this feature.")
@@ -29,31 +29,24 @@ def create_club_assignment_interface(
     assignments = club_manager.metadata['sessions']
     unassigned = [sid for sid in all_session_ids if sid not in assignments]
     
+    # Club suggestions for all unassigned sessions in one batch, looked up by id
+    suggestions = {
+        row[0]: row[1:] for row in club_manager.suggest_clubs(
+            session_summaries.filter(pl.col('session_id').is_in(unassigned))
+        ).select('session_id', 'suggested_club', 'median_carry', 'confidence').iter_rows()
+    }
+    
     # Build session info with club assignments
     session_info = []
     for session_id in sorted(all_session_ids, reverse=True):
-        # Get session stats for club suggestion
-        session_data = session_summaries.filter(
-            pl.col('session_id') == session_id
-        )
-        
         club = club_manager.get_session_club(session_id)
         notes = club_manager.get_session_notes(session_id) or ""
         
         # Suggest club based on median carry if unassigned
         suggestion = ""
-        if not club and len(session_data) > 0:
-            median_carry = session_data.select('median_carry').item()
-            if median_carry:
-                # Find closest club by typical carry
-                closest_club = None
-                min_diff = float('inf')
-                for club_name, specs in club_manager.STANDARD_CLUBS.items():
-                    diff = abs(specs['typical_carry'] - median_carry)
-                    if diff < min_diff:
-                        min_diff = diff
-                        closest_club = club_name
-                suggestion = f" (Suggested: {closest_club} based on {median_carry:.0f}yd carry)"
+        if not club and session_id in suggestions:
+            closest_club, median_carry, confidence = suggestions[session_id]
+            suggestion = f" (Suggested: {closest_club} based on {median_carry:.0f}yd carry, {confidence:.0%} confidence)"
         
         # Format date nicely
         date_str = session_id.replace('session_', '').replace('_', '-')
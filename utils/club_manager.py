@@ -7,6 +7,9 @@ import json
 from pathlib import Path
 from typing import Dict, List, Optional
 from datetime import datetime
+import polars as pl
+from .session_cache import SessionCache
+from .refine_schema import SCHEMA_VERSION
 
 
 class ClubManager:
@@ -32,6 +35,11 @@ class ClubManager:
         'LW': {'type': 'wedge', 'typical_carry': 80, 'optimal_launch': (26, 30), 'optimal_spin': (9000, 12000)},
     }
     
+    # Carry thresholds as a fraction of typical carry, unless a club's specs
+    # set 'min_carry' / 'mishit_carry' explicitly
+    VALID_CARRY_FRACTION = 0.4   # shorter shots are not counted as valid
+    MISHIT_CARRY_FRACTION = 0.25  # shorter shots are mishits
+    
     def __init__(self, metadata_file: str = "data/club_metadata.json"):
         self.metadata_file = Path(metadata_file)
         self.metadata = self._load_metadata()
@@ -113,6 +121,9 @@ class ClubManager:
             'optimal_spin': optimal_spin
         }
         self._save_metadata()
+        
+        # Stored session summaries were flagged against the old specs
+        SessionCache(self.metadata_file.parent / ".cache", version=SCHEMA_VERSION).drop_summary()
     
     def get_club_specs(self, club: str) -> Optional[Dict]:
         """
@@ -129,6 +140,87 @@ class ClubManager:
         else:
             return None
     
+    def get_specs_frame(self) -> pl.DataFrame:
+        """
+        Club specs as a lookup frame for joining onto shot data
+        
+        Returns:
+            DataFrame with one row per standard or custom club: club,
+            typical_carry, launch_min/launch_max (degrees), spin_min/spin_max
+            (RPM), and the min_carry / mishit_carry thresholds in yards
+        """
+        rows = []
+        for club in self.get_club_list():
+            specs = self.get_club_specs(club)
+            rows.append({
+                'club': club,
+                'typical_carry': float(specs['typical_carry']),
+                'launch_min': float(specs['optimal_launch'][0]),
+                'launch_max': float(specs['optimal_launch'][1]),
+                'spin_min': float(specs['optimal_spin'][0]),
+                'spin_max': float(specs['optimal_spin'][1]),
+                'min_carry': float(specs.get('min_carry', specs['typical_carry'] * self.VALID_CARRY_FRACTION)),
+                'mishit_carry': float(specs.get('mishit_carry', specs['typical_carry'] * self.MISHIT_CARRY_FRACTION)),
+            })
+        return pl.DataFrame(rows, schema={
+            'club': pl.Utf8,
+            'typical_carry': pl.Float64,
+            'launch_min': pl.Float64,
+            'launch_max': pl.Float64,
+            'spin_min': pl.Float64,
+            'spin_max': pl.Float64,
+            'min_carry': pl.Float64,
+            'mishit_carry': pl.Float64,
+        })
+    
+    def suggest_clubs(self, sessions: pl.DataFrame, carry_column: str = "median_carry") -> pl.DataFrame:
+        """
+        Suggest the club for many sessions at once from their carry distance
+        
+        Standard and custom clubs are sorted by typical carry and matched to
+        every session with one nearest as-of join.
+        
+        Args:
+            sessions: Frame with one row per session (e.g., the session summary)
+            carry_column: Column holding each session's carry distance
+            
+        Returns:
+            The sessions that have a carry, in their original order, with
+            suggested_club, carry_gap (carry minus the club's typical carry)
+            and confidence: 1 at the club's typical carry, falling to 0 at the
+            typical carry of the next club on that side
+        """
+        clubs = self.get_specs_frame().select("club", "typical_carry").sort("typical_carry").with_columns([
+            # Gaps to the neighboring clubs' typical carries
+            pl.col("typical_carry").diff().alias("_shorter_gap"),
+            (-pl.col("typical_carry").diff(-1)).alias("_longer_gap"),
+        ])
+        
+        carry = pl.col(carry_column).cast(pl.Float64)
+        matched = sessions.with_row_index("_row").filter(carry.is_not_null()).with_columns(
+            carry.alias("_carry")
+        ).sort("_carry").join_asof(
+            clubs.rename({"club": "suggested_club"}),
+            left_on="_carry",
+            right_on="typical_carry",
+            strategy="nearest",
+        )
+        
+        gap = pl.col("_carry") - pl.col("typical_carry")
+        # Beyond the shortest or longest club, use the spacing on the other side
+        spacing = pl.when(gap >= 0).then(
+            pl.col("_longer_gap").fill_null(pl.col("_shorter_gap"))
+        ).otherwise(
+            pl.col("_shorter_gap").fill_null(pl.col("_longer_gap"))
+        )
+        return matched.with_columns([
+            gap.alias("carry_gap"),
+            pl.when(spacing > 0)
+              .then((1 - gap.abs() / spacing).clip(0, 1))
+              .otherwise(1.0)
+              .alias("confidence"),
+        ]).sort("_row").drop("_row", "_carry", "typical_carry", "_shorter_gap", "_longer_gap")
+    
     def remove_session_club(self, session_id: str) -> None:
         """Remove club association from a session"""
         if session_id in self.metadata['sessions']:
@@ -3,22 +3,195 @@ Golf Launch Monitor Data Processing Utilities
 Handles data loading, cleaning, and metric calculation for Uneekor Refine sessions
 """
 
+import functools
+import inspect
+import itertools
+import multiprocessing
+import os
 import polars as pl
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, FIRST_COMPLETED, wait
 from pathlib import Path
-from typing import Optional, List
+from typing import Optional, List, Dict, Union, Iterator
 from datetime import datetime
 from .club_manager import ClubManager
+from .session_cache import SessionCache
+from .refine_schema import (
+    REFINE_SCHEMA, NULL_VALUES, MEASUREMENT_COLUMNS, SHOT_TYPES, COMPACT_INT_DTYPES,
+    SCHEMA_VERSION, parse_measurement
+)
+from .sketches import quantile_sketch, sketch_quantiles, weighted_mean, pooled_std
+from .shot_classifier import ShotClubClassifier, SHOT_FEATURES
+
+
+# Shot metrics with a per-session quantile sketch in the summary table -> sketch name
+SKETCH_METRICS = {
+    "Carry": "carry",
+    "side_dist_signed": "side_dist",
+}
+
+# Shot windows for sessions without a club or clubs without specs
+DEFAULT_SHOT_WINDOWS = {
+    "launch_min": 12.0,
+    "launch_max": 18.0,
+    "spin_min": 2000.0,
+    "spin_max": 4000.0,
+    "min_carry": 50.0,
+    "mishit_carry": 30.0,
+}
+
+# Summary metrics with precomputed baselines (averages over earlier sessions)
+BASELINE_METRICS = [
+    "median_carry",
+    "carry_std",
+    "avg_offline",
+    "directional_std",
+    "strike_quality_rate",
+    "optimal_launch_rate",
+    "straight_rate",
+    "quality_score",
+]
+
+# Summary columns kept for sketch rollups and baselines but not returned by
+# get_session_summary
+INTERNAL_SUMMARY_COLUMNS = "^.*_(centroids|weights|baseline|trailing)$"
+
+
+def _memoize(method):
+    """
+    Cache a query method's result per argument set until the loaded data changes
+    
+    Arguments are normalized against the signature, so get_session_summary()
+    and get_session_summary(club=None) share one entry.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        key = _memo_key(method, self, args, kwargs)
+        if key not in self._memo:
+            self._memo[key] = method(self, *args, **kwargs)
+        return self._memo[key]
+    
+    return wrapper
+
+
+def _memo_key(method, instance, args: tuple, kwargs: dict) -> tuple:
+    """Memo key for a query call: method name plus signature-normalized arguments"""
+    bound = inspect.signature(method).bind(instance, *args, **kwargs)
+    bound.apply_defaults()
+    return (method.__name__, *list(bound.arguments.items())[1:])
 
 
 class GolfDataProcessor:
     """Process and aggregate golf launch monitor data across sessions"""
     
-    def __init__(self, data_dir: str = "data"):
+    # Query methods collect_all() can batch -> method building the query's lazy plan
+    _QUERY_PLANS = {
+        "get_session_summary": "_session_summary_plan",
+        "get_shot_distribution": "_shot_distribution_plan",
+        "calculate_trend": "_trend_plan",
+        "get_club_comparison": "_club_comparison_plan",
+    }
+    
+    def __init__(
+        self,
+        data_dir: str = "data",
+        lazy: bool = False,
+        use_cache: bool = True,
+        max_workers: Optional[int] = None,
+        pool: str = "thread",
+        compact: bool = False,
+        streaming: bool = False,
+        baseline_window: Optional[int] = None
+    ):
+        """
+        Initialize processor
+        
+        Args:
+            data_dir: Directory containing session CSV files
+            lazy: If True, keep sessions as a LazyFrame scan and push session,
+                  club and date filters down to the files each query touches
+            use_cache: If True, keep cleaned sessions as Parquet under
+                       data_dir/.cache and only parse new or changed CSVs
+            max_workers: Worker count for parsing new session files
+                         (None = one per CPU, 1 = sequential)
+            pool: 'thread' or 'process' worker pool
+            compact: If True, store club and shot Type as Enum, session_id and
+                     notes as Categorical, and downcast numerics to Float32/Int16/Int32
+            streaming: If True, never materialize the shot table; queries run
+                       on the Polars streaming engine in bounded memory
+                       (implies lazy)
+            baseline_window: If set, the session summary also carries
+                             trailing baselines over this many earlier sessions
+        """
         self.data_dir = Path(data_dir)
+        self.lazy = lazy or streaming
+        self.streaming = streaming
+        self.max_workers = max_workers
+        self.pool = pool
+        self.compact = compact
+        self.baseline_window = baseline_window
+        self.data_version = 0
+        self._memo: Dict[tuple, pl.DataFrame] = {}
+        self._batching = False
+        self._batch_summary: Optional[pl.LazyFrame] = None
+        self._row_index: Optional[Dict[str, tuple]] = None
         self.df: Optional[pl.DataFrame] = None
+        self.lf: Optional[pl.LazyFrame] = None
+        self.session_files: Dict[str, Path] = {}
+        # Club of each loaded session as of loading, so queries and the catalog
+        # agree with the loaded data until the next load
+        self._assignments: Dict[str, Optional[str]] = {}
+        self._session_summary: Optional[pl.DataFrame] = None
         self.club_manager = ClubManager()
+        self.cache = SessionCache(self.data_dir / ".cache", version=SCHEMA_VERSION) if use_cache else None
         
-    def load_sessions(self, pattern: str = "session_*.csv") -> pl.DataFrame:
+    @property
+    def df(self) -> Optional[pl.DataFrame]:
+        """Loaded shot table (None in lazy mode)"""
+        return self._df
+    
+    @df.setter
+    def df(self, value: Optional[pl.DataFrame]) -> None:
+        self._df = value
+        self._from_files = False
+        self._invalidate()
+    
+    @property
+    def lf(self) -> Optional[pl.LazyFrame]:
+        """Lazy scan over all loaded sessions (lazy mode only)"""
+        return self._lf
+    
+    @lf.setter
+    def lf(self, value: Optional[pl.LazyFrame]) -> None:
+        self._lf = value
+        self._from_files = False
+        self._invalidate()
+    
+    def _invalidate(self) -> None:
+        """Drop memoized query results and the session summary after the loaded data changes"""
+        self.data_version += 1
+        self._memo.clear()
+        self._row_index = None
+        self._session_summary = None
+        self._batch_summary = None
+    
+    @property
+    def _summary_stored(self) -> bool:
+        """Whether the session summary can be read from and saved to the cache"""
+        return self.cache is not None and self._from_files
+    
+    def _replace_data(self, df: Optional[pl.DataFrame] = None, lf: Optional[pl.LazyFrame] = None) -> None:
+        """
+        Replace the loaded data read from session_files
+        
+        Unlike assigning df/lf, this does not mark the data as user-supplied,
+        so the stored session summary (whose rows match the session files)
+        stays usable.
+        """
+        self._df = df
+        self._lf = lf
+        self._invalidate()
+    
+    def load_sessions(self, pattern: str = "session_*.csv") -> Union[pl.DataFrame, pl.LazyFrame]:
         """
         Load and concatenate all session CSV files with club metadata
         
@@ -27,109 +200,661 @@ class GolfDataProcessor:
             
         Returns:
             Combined DataFrame with all sessions including club information
+            (a LazyFrame when the processor is in lazy mode)
         """
         csv_files = list(self.data_dir.glob(pattern))
         
         if not csv_files:
             raise FileNotFoundError(f"No files matching '{pattern}' in {self.data_dir}")
         
-        # Load and concatenate with session metadata
-        dfs = []
-        for file_path in sorted(csv_files):
-            df = pl.read_csv(file_path)
-            # Extract date from filename (format: session_YYYY_MM_DD.csv)
-            date_str = file_path.stem.replace("session_", "")
-            session_date = datetime.strptime(date_str, "%Y_%m_%d")
-            session_id = file_path.stem
-            
-            # Get club metadata
-            club = self.club_manager.get_session_club(session_id)
-            notes = self.club_manager.get_session_notes(session_id) or ""
-            
-            df = df.with_columns([
-                pl.lit(session_date).alias("session_date"),
-                pl.lit(session_id).alias("session_id"),
-                pl.lit(club).alias("club"),
-                pl.lit(notes).alias("session_notes")
-            ])
-            dfs.append(df)
-        
-        self.df = pl.concat(dfs) #### this is a bug currently -- need to diagnose
-        return self._clean_and_enrich()
-    
-    def _clean_and_enrich(self) -> pl.DataFrame:
-        """Clean data and add derived metrics"""
-        
-        df = self.df.with_columns([
-            # Parse numeric fields (handle '--' as null)
-            pl.col("Smash Factor").str.replace("--", "").cast(pl.Float64, strict=False),
-            pl.col("Club Speed").str.replace("--", "").cast(pl.Float64, strict=False),
-            
-            # Parse angles (remove degree symbols)
-            pl.col("Launch Angle").str.replace("°", "").cast(pl.Float64, strict=False),
-            pl.col("Side Angle").str.replace("°", "").cast(pl.Float64, strict=False),
-            
-            # Parse side distance with direction
-            pl.when(pl.col("Side Dist").str.contains("R"))
-              .then(pl.col("Side Dist").str.extract(r"(\d+\.?\d*)", 1).cast(pl.Float64))
-              .when(pl.col("Side Dist").str.contains("L"))
-              .then(-pl.col("Side Dist").str.extract(r"(\d+\.?\d*)", 1).cast(pl.Float64))
-              .otherwise(0.0)
-              .alias("side_dist_signed"),
-            
-            # Flight time to seconds
-            pl.col("Flight Time").str.replace(" s", "").cast(pl.Float64, strict=False).alias("flight_time_sec"),
+        self.session_files = {file_path.stem: file_path for file_path in sorted(csv_files)}
+        self._assignments = {
+            sid: self.club_manager.metadata['sessions'].get(sid) for sid in self.session_files
+        }
+        
+        if self.lazy:
+            self._replace_data(lf=self._scan_sessions())
+        else:
+            self._replace_data(df=self._scan_sessions().collect())
+        
+        self._from_files = True
+        return self.lf if self.lazy else self.df
+    
+    def append_new_sessions(self, pattern: str = "session_*.csv") -> List[str]:
+        """
+        Ingest only session files that are not loaded yet
+        
+        New sessions are cleaned on their own and appended to the loaded data,
+        and the per-session summary (if already computed) gains just their
+        rows, so adding one session never reloads the full history.
+        
+        Args:
+            pattern: Glob pattern for session files (default: session_*.csv)
+            
+        Returns:
+            Session IDs that were added
+        """
+        if not self.session_files:
+            self.load_sessions(pattern)
+            return list(self.session_files)
+        
+        new_files = {
+            file_path.stem: file_path for file_path in sorted(self.data_dir.glob(pattern))
+            if file_path.stem not in self.session_files
+        }
+        if not new_files:
+            return []
+        
+        new_shots = self._scan_sessions(files=new_files)
+        if not self.lazy:
+            new_df = new_shots.collect()
+            new_shots = new_df.lazy()
+        
+        # Summarize before touching any loaded state, so a failure leaves the processor as it was
+        summary = self._session_summary
+        if summary is not None:
+            new_summary = self._collect(self._summarize(new_shots))
+            if new_summary.height == 0:
+                # Sessions without valid shots have no summary rows
+                pass
+            elif summary.height and new_summary["session_date"].min() >= summary["session_date"].max():
+                # Later sessions only need their own baselines; earlier rows are unchanged
+                summary = pl.concat([summary, self._with_baselines(new_summary, summary)], how="vertical")
+            else:
+                base = pl.concat([summary.select(new_summary.columns), new_summary], how="vertical")
+                summary = self._with_baselines(base)
+        
+        self.session_files = dict(sorted({**self.session_files, **new_files}.items()))
+        self._assignments.update({sid: self.club_manager.metadata['sessions'].get(sid) for sid in new_files})
+        if self.lazy:
+            self._replace_data(lf=self._scan_sessions())
+        else:
+            self._replace_data(df=pl.concat([self.df, new_df], how="vertical", rechunk=False))
+        
+        if summary is not None:
+            self._session_summary = summary
+            self._persist_summary(summary)
+        
+        return list(new_files)
+    
+    def _scan_sessions(
+        self,
+        files: Optional[Dict[str, Path]] = None,
+        session_id: Optional[str] = None,
+        club: Optional[str] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None
+    ) -> pl.LazyFrame:
+        """
+        Build a lazy scan over the session files matching the given filters
+        
+        Args:
+            files: Session ID to file mapping to scan (default: all loaded sessions)
+            session_id: Only scan this session
+            club: Only scan sessions assigned to this club
+            start: Only scan sessions on or after this date
+            end: Only scan sessions on or before this date
+            
+        Returns:
+            Cleaned and enriched LazyFrame
+        """
+        files = self.session_files if files is None else files
+        
+        # Session ID and date come from the file name and club from the club
+        # metadata, so filters select files before any data is read
+        metadata = self._session_metadata(list(files))
+        if session_id:
+            metadata = metadata.filter(pl.col("session_id") == session_id)
+        if club:
+            metadata = metadata.filter(pl.col("club") == club)
+        if start:
+            metadata = metadata.filter(pl.col("session_date") >= start)
+        if end:
+            metadata = metadata.filter(pl.col("session_date") <= end)
+        
+        if metadata.height:
+            scans = self._ingest(files, metadata)
+        else:
+            # Keep the schema so downstream queries return empty frames
+            first = next(iter(files))
+            scans = [scan.head(0) for scan in self._ingest(files, self._session_metadata([first]))]
+        
+        # Each session's club windows ride along with its metadata, so one join
+        # gives every shot the thresholds of its own club
+        specs = self.club_manager.get_specs_frame().select("club", *DEFAULT_SHOT_WINDOWS)
+        windows = metadata.join(specs, on="club", how="left").with_columns([
+            pl.col(name).fill_null(default) for name, default in DEFAULT_SHOT_WINDOWS.items()
         ])
+        shots = pl.concat(scans, how="vertical", rechunk=False).join(
+            windows.lazy(), on="session_id", how="left", maintain_order="left"
+        )
+        shots = self._enrich(shots).drop(list(DEFAULT_SHOT_WINDOWS))
+        return self._compact(shots) if self.compact else shots
+    
+    def _session_metadata(self, session_ids: List[str]) -> pl.DataFrame:
+        """
+        Build one row of metadata per session in a single vectorized pass
         
-        # Add shot quality flags
-        df = df.with_columns([
-            # Valid shot: >50 yards carry, reasonable ball speed
-            ((pl.col("Carry") > 50) & (pl.col("Ball Speed") > 60)).alias("valid_shot"),
+        Loaded sessions keep the club they had when loaded; club changes
+        take effect on the next load_sessions().
+        
+        Returns:
+            DataFrame with session_id, session_date, club and session_notes
+        """
+        clubs = {**self.club_manager.metadata['sessions'], **self._assignments}
+        return pl.DataFrame({"session_id": session_ids}, schema={"session_id": pl.Utf8}).with_columns([
+            # Date from filename (format: session_YYYY_MM_DD)
+            pl.col("session_id").str.strptime(pl.Datetime("us"), "session_%Y_%m_%d").alias("session_date"),
+            pl.col("session_id").replace_strict(
+                {sid: club for sid, club in clubs.items() if club is not None}, default=None, return_dtype=pl.Utf8
+            ).alias("club"),
+            pl.col("session_id").replace_strict(
+                self.club_manager.metadata['notes'], default="", return_dtype=pl.Utf8
+            ).alias("session_notes"),
+        ])
+    
+    def _ingest(self, files: Dict[str, Path], metadata: pl.DataFrame) -> List[pl.LazyFrame]:
+        """
+        Get a cleaned scan for each session in metadata, parsing cache misses in parallel
+        
+        Sessions are picked from the club metadata, so the scans for a
+        club-filtered query only touch that club's files. Without the cache,
+        files stay as lazy CSV scans that Polars reads in parallel when the
+        concatenated plan is collected.
+        """
+        partitions = {
+            sid: (club, year) for sid, club, year in
+            metadata.select("session_id", "club", pl.col("session_date").dt.year()).iter_rows()
+        }
+        
+        if self.cache is None:
+            return [self._clean(self._read_csv(sid, files[sid])) for sid in partitions]
+        
+        cached = {sid: self.cache.get(files[sid]) for sid in partitions}
+        misses = [(sid, files[sid]) for sid in partitions if cached[sid] is None]
+        
+        # Each parsed session is written out as soon as it arrives and then dropped
+        for (sid, file_path), df in self._map(_clean_session_file, misses):
+            cached[sid] = self.cache.put(file_path, df, *partitions[sid])
+        self.cache.save()
+        
+        return [pl.scan_parquet(cached[sid]) for sid in partitions]
+    
+    def cache_session(self, file_path: Path) -> None:
+        """
+        Parse one session CSV into the partitioned Parquet cache ahead of the next load
+        
+        Args:
+            file_path: Session CSV in data_dir (format: session_YYYY_MM_DD.csv)
+        """
+        if self.cache is not None:
+            file_path = Path(file_path)
+            self._ingest({file_path.stem: file_path}, self._session_metadata([file_path.stem]))
+    
+    def _map(self, func, items: List[tuple]) -> Iterator[tuple]:
+        """
+        Apply func to each argument tuple on the configured worker pool
+        
+        Yields (args, result) pairs in completion order. In streaming mode at
+        most one result per worker is pending at a time, so a cold start never
+        holds more than a few parsed sessions in memory.
+        """
+        if self.max_workers == 1 or len(items) <= 1:
+            for args in items:
+                yield args, func(*args)
+            return
+        
+        workers = self.max_workers or os.cpu_count() or 1
+        if self.pool == "process":
+            # Polars is multithreaded, so forked workers can deadlock; spawn instead
+            executor = ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context("spawn"))
+        else:
+            executor = ThreadPoolExecutor(workers)
+        
+        queue = iter(items)
+        with executor:
+            pending = {
+                executor.submit(func, *args): args
+                for args in itertools.islice(queue, workers if self.streaming else len(items))
+            }
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    args = pending.pop(future)
+                    for next_args in itertools.islice(queue, 1):
+                        pending[executor.submit(func, *next_args)] = next_args
+                    yield args, future.result()
+    
+    @staticmethod
+    def _read_csv(session_id: str, file_path: Path) -> pl.LazyFrame:
+        """Lazily scan one raw session CSV tagged with its session ID"""
+        # Pinned dtypes instead of per-file inference, so every file has the
+        # same schema regardless of '--' or empty cells
+        return pl.scan_csv(
+            file_path,
+            schema_overrides=REFINE_SCHEMA,
+            infer_schema=False,
+            null_values=NULL_VALUES,
+        ).with_columns(pl.lit(session_id).alias("session_id"))
+    
+    @staticmethod
+    def _clean(lf: pl.LazyFrame) -> pl.LazyFrame:
+        """Parse raw Refine text columns into numeric fields"""
+        
+        # Direction-prefixed and unit-suffixed columns become signed floats
+        lf = lf.with_columns([parse_measurement(c) for c in MEASUREMENT_COLUMNS])
+        
+        return lf.with_columns([
+            # Side distance with direction (missing readings count as on line)
+            pl.col("Side Dist").fill_null(0.0).alias("side_dist_signed"),
+            
+            # Flight time in seconds
+            pl.col("Flight Time").alias("flight_time_sec"),
+        ])
+    
+    def _enrich(self, lf: pl.LazyFrame) -> pl.LazyFrame:
+        """
+        Add shot quality flags to cleaned data
+        
+        Carry, launch and spin thresholds come from the per-shot club window
+        columns (see DEFAULT_SHOT_WINDOWS) joined on from the club specs.
+        """
+        
+        return lf.with_columns([
+            # Valid shot: carry reaches the club's minimum, reasonable ball speed
+            ((pl.col("Carry") > pl.col("min_carry")) & (pl.col("Ball Speed") > 60)).alias("valid_shot"),
             
             # Quality strike: good smash factor
             (pl.col("Smash Factor") > 1.25).alias("quality_strike"),
             
-            # Mishit: very short distance
-            (pl.col("Carry") < 30).alias("mishit"),
+            # Mishit: very short distance for the club
+            (pl.col("Carry") < pl.col("mishit_carry")).alias("mishit"),
             
-            # Optimal launch window (adjust these based on your clubs)
+            # Optimal launch window for the club
             (
-                pl.col("Launch Angle").is_between(12, 18) & 
-                pl.col("Back Spin").is_between(2000, 4000)
+                pl.col("Launch Angle").is_between(pl.col("launch_min"), pl.col("launch_max")) &
+                pl.col("Back Spin").is_between(pl.col("spin_min"), pl.col("spin_max"))
             ).alias("optimal_launch"),
         ])
+    
+    def _collect(self, lf: pl.LazyFrame) -> pl.DataFrame:
+        """Execute a query, on the streaming engine when in streaming mode"""
+        return lf.collect(engine="streaming" if self.streaming else "auto")
+    
+    def collect_all(self, queries: Dict[str, tuple]) -> Dict[str, pl.DataFrame]:
+        """
+        Run several queries as one batch with pl.collect_all
+        
+        The lazy plans of all queries that are not memoized yet execute
+        together, so Polars can share common subplans (the shot scan, the
+        valid_shot filter, the session summary) and run them in parallel.
+        Results are memoized as if each query method had been called.
+        
+        Args:
+            queries: Output name -> (query method name, keyword arguments), e.g.
+                     {'carry_trend': ('calculate_trend', {'metric': 'carry_std', 'club': 'PW'})}
+            
+        Returns:
+            Output name -> DataFrame
+        """
+        keys = {}
+        plans = {}
+        for name, (method, kwargs) in queries.items():
+            if method not in self._QUERY_PLANS:
+                raise ValueError(f"Cannot batch '{method}'; choose from {list(self._QUERY_PLANS)}")
+            key = _memo_key(getattr(type(self), method), self, (), kwargs)
+            keys[name] = key
+            if key not in self._memo and key not in plans:
+                self._batching = True
+                try:
+                    plans[key] = self._plan(method, **kwargs)
+                finally:
+                    self._batching = False
+        
+        # Queries built on the summary share one plan of the full summary
+        # table, which runs in the batch and is kept for slicing and appends
+        batch = list(plans.values())
+        if self._batch_summary is not None:
+            batch.append(self._batch_summary)
+            self._batch_summary = None
+        
+        results = pl.collect_all(batch, engine="streaming" if self.streaming else "auto")
+        if len(results) > len(plans):
+            self._session_summary = results.pop()
+        self._memo.update(zip(plans, results))
+        
+        return {name: self._memo[key] for name, key in keys.items()}
+    
+    def _plan(self, method: str, **kwargs) -> pl.LazyFrame:
+        """
+        Lazy input for a plan built on another query's output
+        
+        While batching, queries that are not memoized yet stay lazy so they
+        join the batch; otherwise the query runs (and is memoized) on its own.
+        """
+        key = _memo_key(getattr(type(self), method), self, (), kwargs)
+        if self._batching and key not in self._memo:
+            return getattr(self, self._QUERY_PLANS[method])(**kwargs)
+        return getattr(self, method)(**kwargs).lazy()
+    
+    def _compact(self, lf: pl.LazyFrame) -> pl.LazyFrame:
+        """Store repeated strings as Enum/Categorical and downcast numeric columns"""
+        # Include assigned clubs missing from the club list so no club maps to null
+        clubs = sorted(set(self.club_manager.get_club_list()) | set(self.club_manager.metadata['sessions'].values()))
+        
+        return lf.with_columns([
+            pl.col(pl.Float64).cast(pl.Float32),
+            *[pl.col(c).cast(dtype) for c, dtype in COMPACT_INT_DTYPES.items()],
+            pl.col("club").cast(pl.Enum(clubs)),
+            # Shot types outside SHOT_TYPES become null
+            pl.col("Type").cast(pl.Enum(SHOT_TYPES), strict=False),
+            pl.col("session_id", "session_notes").cast(pl.Categorical),
+        ])
+    
+    def _shots(
+        self,
+        session_id: Optional[str] = None,
+        club: Optional[str] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None
+    ) -> pl.LazyFrame:
+        """
+        Get a lazy view of the shot table, optionally filtered
+        
+        In lazy mode the filters prune session files; otherwise they select
+        row blocks of the loaded DataFrame.
+        """
+        if self.lazy:
+            if self.lf is None:
+                raise ValueError("No data loaded. Call load_sessions() first.")
+            if not self._from_files:
+                # An assigned scan is filtered as is instead of rescanning the session files
+                return self._filter_summary(self.lf, session_id, club, start, end)
+            return self._scan_sessions(session_id=session_id, club=club, start=start, end=end)
+        
+        return self.get_shots(session_id, club, start, end).lazy()
+    
+    def get_shots(
+        self,
+        session_id: Optional[str] = None,
+        club: Optional[str] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None
+    ) -> pl.DataFrame:
+        """
+        Get the shots matching a session, club and date range
+        
+        In eager mode the slices come from a row index over the loaded
+        frame, so they are zero-copy views found without scanning it. In
+        lazy mode only the matching session files are read.
+        
+        Args:
+            session_id: Session to return (None = all sessions)
+            club: Club to return (None = all clubs)
+            start: Only sessions on or after this date
+            end: Only sessions on or before this date
+            
+        Returns:
+            DataFrame of shots
+        """
+        if self.lazy:
+            return self._collect(self._shots(session_id, club, start, end))
+        
+        if self.df is None:
+            raise ValueError("No data loaded. Call load_sessions() first.")
+        
+        index = self._session_rows()
+        if not index:
+            # Rows of a session are not contiguous, e.g. in an assigned, re-sorted frame
+            return self._filter_summary(self.df, session_id, club, start, end)
         
-        self.df = df
-        return df
+        candidates = [session_id] if session_id else list(index)
+        blocks = [
+            index[sid] for sid in candidates if sid in index
+            and (not club or index[sid][2] == club)
+            and (not start or index[sid][3] >= start)
+            and (not end or index[sid][3] <= end)
+        ]
+        
+        if len(blocks) == len(index):
+            return self.df
+        slices = [self.df.slice(offset, length) for offset, length, _, _ in blocks]
+        return pl.concat(slices, rechunk=False) if slices else self.df.clear()
     
-    def get_session_summary(self, session_id: Optional[str] = None, club: Optional[str] = None) -> pl.DataFrame:
+    def _session_rows(self) -> Dict[str, tuple]:
+        """
+        Row index of the loaded frame: session_id -> (offset, length, club, session_date)
+        
+        Every session is ingested as one contiguous block of rows, so one
+        pass over the session_id column locates all of them; the index is
+        rebuilt after the data changes. A frame whose sessions are not
+        contiguous (e.g. an assigned frame sorted by another column) gets an
+        empty index.
+        """
+        if self._row_index is None:
+            blocks = self.df.select(
+                pl.col("session_id", "club").cast(pl.Utf8), "session_date"
+            ).with_row_index("offset").group_by("session_id", maintain_order=True).agg(
+                pl.col("offset").first(),
+                pl.len().alias("length"),
+                pl.col("club").first(),
+                pl.col("session_date").first(),
+                pl.col("offset").last().alias("last"),
+            )
+            if (blocks["last"] - blocks["offset"] + 1 != blocks["length"]).any():
+                self._row_index = {}
+                return self._row_index
+            
+            blocks = blocks.drop("last")
+            self._row_index = {
+                sid: (offset, length, club, date) for sid, offset, length, club, date in blocks.iter_rows()
+            }
+        return self._row_index
+    
+    @_memoize
+    def get_session_summary(
+        self,
+        session_id: Optional[str] = None,
+        club: Optional[str] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None
+    ) -> pl.DataFrame:
         """
         Calculate summary statistics for a session or all sessions
         
         Args:
             session_id: Specific session to analyze (None = all sessions)
             club: Filter to specific club (None = all clubs)
+            start: Only sessions on or after this date
+            end: Only sessions on or before this date
             
         Returns:
             DataFrame with aggregated metrics
         """
-        df = self.df
+        summary = self._filter_summary(self._summary_rows(), session_id, club, start, end)
+        return summary.select(pl.exclude(INTERNAL_SUMMARY_COLUMNS))
+    
+    def _summary_rows(self) -> pl.DataFrame:
+        """
+        All-sessions summary table, including sketch and baseline columns
+        
+        Rows are per session and each session has one club and date, so
+        filtered summaries are slices of this table, whose baselines always
+        cover every earlier session.
+        """
+        if self._session_summary is None and self._summary_stored:
+            self._session_summary = self._with_baselines(self._load_session_summary())
+        elif self._session_summary is None:
+            self._session_summary = self._collect(self._with_baselines(self._summarize(self._shots())))
+        return self._session_summary
+    
+    def _summary_rows_plan(self) -> pl.LazyFrame:
+        """Lazy _summary_rows; while batching, one shared plan joins the batch"""
+        if self._batching and self._session_summary is None and not self._summary_stored:
+            if self._batch_summary is None:
+                self._batch_summary = self._with_baselines(self._summarize(self._shots()))
+            return self._batch_summary
+        return self._summary_rows().lazy()
+    
+    @staticmethod
+    def _filter_summary(
+        summary: Union[pl.DataFrame, pl.LazyFrame],
+        session_id: Optional[str] = None,
+        club: Optional[str] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None
+    ) -> Union[pl.DataFrame, pl.LazyFrame]:
+        """Slice summary rows by session, club and date range"""
         if session_id:
-            df = df.filter(pl.col("session_id") == session_id)
+            summary = summary.filter(pl.col("session_id") == session_id)
         if club:
-            df = df.filter(pl.col("club") == club)
+            summary = summary.filter(pl.col("club") == club)
+        if start:
+            summary = summary.filter(pl.col("session_date") >= start)
+        if end:
+            summary = summary.filter(pl.col("session_date") <= end)
+        return summary
+    
+    def _session_summary_plan(
+        self,
+        session_id: Optional[str] = None,
+        club: Optional[str] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None
+    ) -> pl.LazyFrame:
+        """Lazy plan for get_session_summary"""
+        summary = self._filter_summary(self._summary_rows_plan(), session_id, club, start, end)
+        return summary.select(pl.exclude(INTERNAL_SUMMARY_COLUMNS))
+    
+    def _with_baselines(
+        self,
+        summary: Union[pl.DataFrame, pl.LazyFrame],
+        history: Optional[pl.DataFrame] = None
+    ) -> Union[pl.DataFrame, pl.LazyFrame]:
+        """
+        Add baseline columns to per-session summary rows
+        
+        For each metric in BASELINE_METRICS, `<metric>_baseline` averages all
+        earlier sessions and `<metric>_club_baseline` earlier sessions with
+        the same club; with baseline_window set, `<metric>_trailing` and
+        `<metric>_club_trailing` average only the last baseline_window of them.
+        
+        Args:
+            summary: Summary rows without baselines
+            history: Summary of the sessions preceding all of `summary`'s rows;
+                     only `summary`'s rows are returned
+        """
+        frame = summary
+        if history is not None:
+            frame = pl.concat([history.select(summary.columns), summary], how="vertical")
+        
+        baselines = []
+        for metric in BASELINE_METRICS:
+            earlier = pl.col(metric).shift(1)
+            count = earlier.is_not_null().cum_sum()
+            expanding = pl.when(count > 0).then(earlier.fill_null(0).cum_sum() / count)
+            baselines += [
+                expanding.alias(f"{metric}_baseline"),
+                expanding.over("club").alias(f"{metric}_club_baseline"),
+            ]
+            if self.baseline_window:
+                trailing = earlier.rolling_mean(window_size=self.baseline_window, min_samples=1)
+                baselines += [
+                    trailing.alias(f"{metric}_trailing"),
+                    trailing.over("club").alias(f"{metric}_club_trailing"),
+                ]
+        
+        frame = frame.sort("session_date", maintain_order=True).with_columns(baselines)
+        return frame if history is None else frame.tail(summary.height)
+    
+    def get_session_baseline(self, session_id: str, scope: str = "all", trailing: bool = False) -> pl.DataFrame:
+        """
+        Baseline to compare a session against, read from its summary row
+        
+        Args:
+            session_id: Session to compare
+            scope: 'all' = earlier sessions of any club, 'club' = earlier
+                   sessions with the same club
+            trailing: If True, use only the last baseline_window earlier sessions
+            
+        Returns:
+            One-row DataFrame with each BASELINE_METRICS metric under its own
+            name (null where there is no earlier session)
+        """
+        if trailing and not self.baseline_window:
+            raise ValueError("Trailing baselines need GolfDataProcessor(baseline_window=N)")
+        
+        suffix = ("_club" if scope == "club" else "") + ("_trailing" if trailing else "_baseline")
+        row = self._filter_summary(self._summary_rows(), session_id=session_id)
+        return row.select([pl.col(f"{metric}{suffix}").alias(metric) for metric in BASELINE_METRICS])
+    
+    def _load_session_summary(self) -> pl.DataFrame:
+        """
+        Per-session summary for all loaded sessions, backed by the persisted table
+        
+        Stored rows are reused while the session's CSV hash and club are
+        unchanged; only new, modified or re-assigned sessions are summarized
+        from shot data, and the table is saved again if any row changed.
+        """
+        current = self._session_metadata(list(self.session_files)).select([
+            "session_id",
+            pl.col("club").alias("current_club"),
+            pl.col("session_id").replace_strict(
+                {sid: self.cache.fingerprint(file_path) for sid, file_path in self.session_files.items()},
+                default=None, return_dtype=pl.Utf8
+            ).alias("sha256"),
+        ])
+        
+        fresh = None
+        stored = self.cache.read_summary()
+        if stored is not None:
+            fresh = stored.join(current, on=["session_id", "sha256"], how="inner").filter(
+                pl.col("club").eq_missing(pl.col("current_club"))
+            ).drop("current_club", "sha256")
+        
+        reused = set() if fresh is None else set(fresh["session_id"])
+        stale = {sid: file_path for sid, file_path in self.session_files.items() if sid not in reused}
+        if not stale:
+            return fresh.sort("session_date")
         
+        summary = self._collect(self._summarize(self._scan_sessions(files=stale)))
+        if fresh is not None:
+            summary = pl.concat([fresh, summary], how="vertical")
+        
+        summary = summary.sort("session_date")
+        self._persist_summary(summary)
+        return summary
+    
+    def _persist_summary(self, summary: pl.DataFrame) -> None:
+        """
+        Save the per-session summary with the CSV hash each row was built from
+        
+        Baselines depend on the other sessions loaded, so they are not stored.
+        """
+        if not self._summary_stored:
+            return
+        
+        hashes = {sid: self.cache.recorded_hash(file_path) for sid, file_path in self.session_files.items()}
+        summary = summary.select(pl.exclude("^.*_(baseline|trailing)$"))
+        self.cache.write_summary(summary.with_columns(
+            pl.col("session_id").replace_strict(hashes, default=None, return_dtype=pl.Utf8).alias("sha256")
+        ))
+    
+    def _summarize(self, shots: pl.LazyFrame) -> pl.LazyFrame:
+        """Aggregate shots into one row of metrics per session"""
         # Filter to valid shots for statistics
-        valid_df = df.filter(pl.col("valid_shot"))
+        valid_df = shots.filter(pl.col("valid_shot"))
         
         summary = valid_df.group_by("session_id", "session_date", "club").agg([
             # Distance metrics
             pl.col("Carry").median().alias("median_carry"),
+            pl.col("Carry").mean().alias("avg_carry"),
             pl.col("Carry").std().alias("carry_std"),
             pl.col("Total").median().alias("median_total"),
             
             # Directional metrics
             pl.col("side_dist_signed").abs().mean().alias("avg_offline"),
+            pl.col("side_dist_signed").mean().alias("avg_side_dist"),
             pl.col("side_dist_signed").std().alias("directional_std"),
             
             # Strike quality
@@ -142,15 +867,24 @@ class GolfDataProcessor:
             pl.col("Back Spin").mean().alias("avg_backspin"),
             
             # Shot shape distribution
-            (pl.col("Type").str.contains("Slice").sum() / pl.len()).alias("slice_rate"),
-            (pl.col("Type").str.contains("Hook").sum() / pl.len()).alias("hook_rate"),
-            (pl.col("Type").str.contains("Straight").sum() / pl.len()).alias("straight_rate"),
+            (pl.col("Type").cast(pl.Utf8).str.contains("Slice").sum() / pl.len()).alias("slice_rate"),
+            (pl.col("Type").cast(pl.Utf8).str.contains("Hook").sum() / pl.len()).alias("hook_rate"),
+            (pl.col("Type").cast(pl.Utf8).str.contains("Straight").sum() / pl.len()).alias("straight_rate"),
             
             # Quality metrics
             (pl.col("optimal_launch").sum() / pl.len()).alias("optimal_launch_rate"),
             pl.len().alias("valid_shots"),
         ])
         
+        for column, name in SKETCH_METRICS.items():
+            summary = summary.join(quantile_sketch(valid_df, column, name), on="session_id", how="left")
+        
+        # Summaries are small, so return plain strings and Float64 in every mode
+        summary = summary.with_columns([
+            pl.col("session_id", "club").cast(pl.Utf8),
+            pl.col(pl.Float32).cast(pl.Float64),
+        ])
+        
         # Add composite quality score
         summary = summary.with_columns([
             (
@@ -163,17 +897,65 @@ class GolfDataProcessor:
         
         return summary.sort("session_date")
     
+    def get_session_catalog(self, pattern: str = "session_*.csv") -> pl.DataFrame:
+        """
+        List sessions without reading any shot data
+        
+        Built from the session file names, club metadata and cache manifest,
+        so it costs O(sessions) and works before load_sessions().
+        
+        Args:
+            pattern: Glob pattern for session files when none are loaded yet
+            
+        Returns:
+            DataFrame sorted by date with session_id, session_date, club,
+            has_notes, shot_count and sha256 (both recorded when the session
+            was cached; null for sessions not cached yet)
+        """
+        files = self.session_files or {
+            file_path.stem: file_path for file_path in sorted(self.data_dir.glob(pattern))
+        }
+        if not files:
+            raise FileNotFoundError(f"No files matching '{pattern}' in {self.data_dir}")
+        
+        recorded = {
+            sid: (self.cache.recorded_shot_count(file_path), self.cache.recorded_hash(file_path))
+            if self.cache is not None else (None, None)
+            for sid, file_path in files.items()
+        }
+        
+        catalog = self._session_metadata(list(files)).with_columns([
+            (pl.col("session_notes") != "").alias("has_notes"),
+            pl.Series("shot_count", [count for count, _ in recorded.values()], dtype=pl.UInt32),
+            pl.Series("sha256", [sha for _, sha in recorded.values()], dtype=pl.Utf8),
+        ]).drop("session_notes")
+        
+        return catalog.sort("session_date")
+    
     def get_latest_session_id(self) -> str:
         """Get the most recent session ID"""
-        return self.df.select(pl.col("session_id")).unique().sort().tail(1).item()
+        return self.get_session_catalog().select(pl.col("session_id").last()).item()
     
-    def get_shot_distribution(self, session_id: Optional[str] = None, club: Optional[str] = None) -> pl.DataFrame:
-        """Get shot pattern distribution for scatter plots"""
-        df = self.df.filter(pl.col("valid_shot"))
-        if session_id:
-            df = df.filter(pl.col("session_id") == session_id)
-        if club:
-            df = df.filter(pl.col("club") == club)
+    @_memoize
+    def get_shot_distribution(
+        self,
+        session_id: Optional[str] = None,
+        club: Optional[str] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None
+    ) -> pl.DataFrame:
+        """Get shot pattern distribution for scatter plots, optionally limited to a date range"""
+        return self._collect(self._shot_distribution_plan(session_id, club, start, end))
+    
+    def _shot_distribution_plan(
+        self,
+        session_id: Optional[str] = None,
+        club: Optional[str] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None
+    ) -> pl.LazyFrame:
+        """Lazy plan for get_shot_distribution"""
+        df = self._shots(session_id, club, start, end).filter(pl.col("valid_shot"))
         
         return df.select([
             "Carry",
@@ -186,45 +968,110 @@ class GolfDataProcessor:
             "club"
         ])
     
-    def calculate_trend(self, metric: str, window: int = 3, club: Optional[str] = None) -> pl.DataFrame:
+    @_memoize
+    def calculate_trend(
+        self,
+        metric: str,
+        window: Union[int, str] = 3,
+        club: Optional[str] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None
+    ) -> pl.DataFrame:
         """
         Calculate rolling average trend for a metric
         
         Args:
             metric: Column name to trend
-            window: Number of sessions for rolling average
+            window: Number of sessions for rolling average, or a duration
+                    string (e.g., '30d', '2w', '3mo') for a time-based window
+                    ending at each session's date
             club: Filter to specific club (None = all clubs)
+            start: Only sessions on or after this date
+            end: Only sessions on or before this date
             
         Returns:
             DataFrame with trend data
         """
-        summary = self.get_session_summary(club=club)
+        return self._collect(self._trend_plan(metric, window, club, start, end))
+    
+    def _trend_plan(
+        self,
+        metric: str,
+        window: Union[int, str] = 3,
+        club: Optional[str] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None
+    ) -> pl.LazyFrame:
+        """Lazy plan for calculate_trend"""
+        summary = self._plan("get_session_summary", club=club, start=start, end=end)
+        
+        if isinstance(window, str):
+            rolling = pl.col(metric).rolling_mean_by("session_date", window_size=window)
+        else:
+            rolling = pl.col(metric).rolling_mean(window_size=window)
         
         trend = summary.select([
             "session_date",
             "session_id",
             "club",
             pl.col(metric),
-            pl.col(metric).rolling_mean(window_size=window).alias(f"{metric}_trend")
+            rolling.alias(f"{metric}_trend")
         ])
         
         return trend
     
     def get_all_clubs(self) -> List[str]:
         """Get list of all clubs used in loaded sessions"""
-        return sorted([c for c in self.df.select(pl.col("club")).unique().to_series().to_list() if c is not None])
+        return self.get_session_catalog().select(pl.col("club").drop_nulls().unique().sort()).to_series().to_list()
     
-    def get_club_comparison(self) -> pl.DataFrame:
+    @_memoize
+    def get_club_comparison(self, exact: bool = False) -> pl.DataFrame:
         """
         Generate comparison statistics across all clubs
         
+        Built by merging the per-session summary table: counts, rates and
+        means are shot-weighted, standard deviations are pooled exactly and
+        median carry comes from the merged quantile sketches, with its
+        worst-case rank error in `median_carry_rank_error`.
+        
+        Args:
+            exact: If True, aggregate raw shots instead (exact medians, no error column)
+        
         Returns:
             DataFrame with key metrics aggregated by club
         """
-        if self.df is None:
-            raise ValueError("No data loaded. Call load_sessions() first.")
+        return self._collect(self._club_comparison_plan(exact))
+    
+    def _club_comparison_plan(self, exact: bool = False) -> pl.LazyFrame:
+        """Lazy plan for get_club_comparison"""
+        if exact:
+            return self._club_comparison_from_shots()
         
-        valid_df = self.df.filter(pl.col("valid_shot") & pl.col("club").is_not_null())
+        sessions = self._summary_rows_plan().filter(pl.col("club").is_not_null())
+        
+        comparison = sessions.group_by("club").agg([
+            pooled_std("valid_shots", "avg_carry", "carry_std").alias("carry_std"),
+            weighted_mean("avg_offline", "valid_shots").alias("avg_offline"),
+            pooled_std("valid_shots", "avg_side_dist", "directional_std").alias("directional_std"),
+            weighted_mean("strike_quality_rate", "valid_shots").alias("strike_quality_rate"),
+            weighted_mean("avg_ball_speed", "valid_shots").alias("avg_ball_speed"),
+            pl.col("valid_shots").sum().cast(pl.UInt32).alias("total_shots"),
+            pl.len().alias("num_sessions"),
+        ])
+        
+        medians = sketch_quantiles(sessions, "carry", [0.5], by="club").rename({
+            "p50": "median_carry",
+            "rank_error": "median_carry_rank_error",
+        })
+        comparison = comparison.join(medians, on="club").select(
+            "club", "median_carry", pl.exclude("club", "median_carry")
+        )
+        
+        return comparison.sort("median_carry", descending=True)
+    
+    def _club_comparison_from_shots(self) -> pl.LazyFrame:
+        """Club comparison aggregated directly from valid shots"""
+        valid_df = self._shots().filter(pl.col("valid_shot") & pl.col("club").is_not_null())
         
         comparison = valid_df.group_by("club").agg([
             pl.col("Carry").median().alias("median_carry"),
@@ -237,10 +1084,116 @@ class GolfDataProcessor:
             pl.col("session_id").n_unique().alias("num_sessions")
         ])
         
+        comparison = comparison.with_columns([
+            pl.col("club").cast(pl.Utf8),
+            pl.col(pl.Float32).cast(pl.Float64),
+        ])
+        
         return comparison.sort("median_carry", descending=True)
     
+    @_memoize
+    def get_percentiles(
+        self,
+        metric: str = "Carry",
+        quantiles: tuple = (0.1, 0.5, 0.9),
+        by: Optional[str] = "club",
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> pl.DataFrame:
+        """
+        Percentiles of a shot metric merged from per-session sketches
+        
+        Args:
+            metric: Sketched shot metric ('Carry' or 'side_dist_signed')
+            quantiles: Quantiles in [0, 1]
+            by: Summary column to group by (e.g., 'club'); None = all sessions
+            start: Only sessions on or after this date
+            end: Only sessions on or before this date
+            
+        Returns:
+            DataFrame with a `p<q>` column per quantile (e.g., p10, p50, p90)
+            and `rank_error`, the worst-case rank error as a fraction of shots
+        """
+        if metric not in SKETCH_METRICS:
+            raise ValueError(f"No sketch for '{metric}'; choose from {list(SKETCH_METRICS)}")
+        
+        sessions = self._summary_rows()
+        if by:
+            sessions = sessions.filter(pl.col(by).is_not_null())
+        if start:
+            sessions = sessions.filter(pl.col("session_date") >= start)
+        if end:
+            sessions = sessions.filter(pl.col("session_date") <= end)
+        
+        percentiles = sketch_quantiles(sessions, SKETCH_METRICS[metric], quantiles, by=by)
+        return percentiles.sort(by) if by else percentiles
+    
+    def get_club_suggestions(self) -> pl.DataFrame:
+        """
+        Suggest a club for every session without one, in one vectorized call
+        
+        Returns:
+            DataFrame with session_id, session_date, median_carry,
+            suggested_club, carry_gap and confidence (see ClubManager.suggest_clubs)
+        """
+        unassigned = self.get_session_summary().filter(
+            ~pl.col("session_id").is_in(list(self.club_manager.metadata['sessions']))
+        )
+        return self.club_manager.suggest_clubs(unassigned.select("session_id", "session_date", "median_carry"))
+    
+    def classify_shots(self, session_id: Optional[str] = None, min_shots: int = 5) -> pl.DataFrame:
+        """
+        Label individual shots with their most likely club
+        
+        A nearest-centroid classifier is fitted on the valid shots of
+        sessions with a club assigned, over ball speed, launch angle, back
+        spin, carry and club speed, and applied to every shot at once. Useful
+        for sessions where several clubs were hit.
+        
+        Args:
+            session_id: Session to label (None = all sessions without a club)
+            min_shots: Clubs with fewer valid assigned shots are not learned
+        
+        Returns:
+            DataFrame with session_id, session_date, No, club, the
+            feature columns, valid_shot, predicted_club, club_distance and
+            club_confidence (see ShotClubClassifier.predict)
+        """
+        columns = ["session_id", "session_date", "No", "club", *SHOT_FEATURES, "valid_shot"]
+        shots = self._collect(self._shots().select(columns).with_columns(
+            pl.col("session_id", "club").cast(pl.Utf8)
+        ))
+        
+        classifier = ShotClubClassifier(min_shots=min_shots).fit(
+            shots.filter(pl.col("club").is_not_null() & pl.col("valid_shot"))
+        )
+        targets = shots.filter(
+            pl.col("session_id") == session_id if session_id else pl.col("club").is_null()
+        )
+        return classifier.predict(targets)
+        
+    def get_shot_club_suggestions(self, min_shots: int = 5, min_share: float = 0.2) -> pl.DataFrame:
+        """
+        Suggest clubs for every session without one from its shot labels
+        
+        Args:
+            min_shots: Clubs with fewer valid assigned shots are not learned
+            min_share: Minimum share of a session's shots for a club to be
+                       listed in its club mix
+        
+        Returns:
+            DataFrame with session_id, suggested_club, share and club_mix
+            (see ShotClubClassifier.summarize_sessions)
+        """
+        labeled = self.classify_shots(min_shots=min_shots).filter(pl.col("valid_shot"))
+        return ShotClubClassifier.summarize_sessions(labeled, min_share=min_share)
+    
     def get_sessions_without_clubs(self) -> List[str]:
         """Get list of session IDs that don't have club metadata"""
-        sessions = self.df.select(["session_id", "club"]).unique()
-        missing = sessions.filter(pl.col("club").is_null())
-        return missing.select(pl.col("session_id")).to_series().to_list()
+        catalog = self.get_session_catalog()
+        return catalog.filter(pl.col("club").is_null()).get_column("session_id").to_list()
+
+
+def _clean_session_file(session_id: str, file_path: Path) -> pl.DataFrame:
+    """Read and clean one session CSV (module level so process pools can pickle it)"""
+    return GolfDataProcessor._clean(GolfDataProcessor._read_csv(session_id, file_path)).collect()
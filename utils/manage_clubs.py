@@ -41,22 +41,19 @@ def list_clubs(club_mgr: ClubManager):
 def list_sessions(club_mgr: ClubManager, show_all: bool = False):
     """List sessions and their club assignments"""
     try:
-        processor = GolfDataProcessor()
-        processor.load_sessions()
-        
-        sessions = processor.df.select(["session_id", "session_date", "club"]).unique().sort("session_date")
-        sessions_df = sessions.to_pandas()
+        # The catalog comes from file names and metadata; no CSV is parsed
+        catalog = GolfDataProcessor().get_session_catalog()
         
         print("\n📅 Sessions:\n")
         
         has_club = []
         missing_club = []
         
-        for _, row in sessions_df.iterrows():
-            session_id = row['session_id']
-            date = row['session_date'].strftime('%Y-%m-%d')
-            club = row['club']
-            notes = club_mgr.get_session_notes(session_id)
+        for session_id, session_date, club, has_notes in catalog.select(
+            ["session_id", "session_date", "club", "has_notes"]
+        ).iter_rows():
+            date = session_date.strftime('%Y-%m-%d')
+            notes = club_mgr.get_session_notes(session_id) if has_notes else ""
             
             if club:
                 has_club.append((date, session_id, club, notes))
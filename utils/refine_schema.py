@@ -0,0 +1,100 @@
+"""
+Uneekor Refine CSV Schema
+Canonical column types, null tokens and unit suffixes for Refine session exports
+"""
+
+import polars as pl
+
+
+# Bump whenever the schema, cleaning pipeline or cache layout changes so cached sessions are rebuilt
+SCHEMA_VERSION = 7
+
+# Cell values Refine writes when the monitor has no reading
+NULL_VALUES = ["--", ""]
+
+# Explicit dtype for every Refine column, applied at read time. Columns with a
+# direction prefix ('R 26.7') or unit suffix ('11.7°', '3.3 s') are read as
+# text and converted by parse_measurement.
+REFINE_SCHEMA = {
+    "No": pl.Int64,
+    "Carry": pl.Float64,
+    "Total": pl.Float64,
+    "Side Dist": pl.Utf8,
+    "Smash Factor": pl.Float64,
+    "Club Speed": pl.Float64,
+    "Ball Speed": pl.Float64,
+    "Back Spin": pl.Int64,
+    "Side Spin": pl.Utf8,
+    "Launch Angle": pl.Utf8,
+    "Side Angle": pl.Utf8,
+    "Decent Angle": pl.Utf8,
+    "Apex": pl.Int64,
+    "Flight Time": pl.Utf8,
+    "Type": pl.Utf8,
+    "Spin Axis": pl.Utf8,
+    "Total Spin": pl.Int64,
+    "Face Angle": pl.Utf8,
+    "Club Path": pl.Utf8,
+    "Attack Angle": pl.Utf8,
+    "Club Lie": pl.Utf8,
+    "Impact Pos X": pl.Utf8,
+    "Impact Pos Y": pl.Utf8,
+    "Dynamic Loft": pl.Utf8,
+    "Face to Path": pl.Utf8,
+    "Dist to Apex": pl.Float64,
+}
+
+# Shot shapes Refine reports in the Type column
+SHOT_TYPES = ["Straight", "Push", "Pull"] + [
+    f"{start}{curve}"
+    for start in ["", "Push ", "Pull ", "Straight "]
+    for curve in ["Slice", "Hook", "Fade", "Draw"]
+]
+
+# Integer columns whose launch monitor range fits a narrower type
+COMPACT_INT_DTYPES = {
+    "No": pl.Int16,
+    "Apex": pl.Int16,
+    "Back Spin": pl.Int32,
+    "Total Spin": pl.Int32,
+}
+
+# Text columns holding a measurement with an optional direction prefix and
+# unit suffix: 'R 26.7', 'L 273', '11.7°', 'R 14.3°', '-37.9°', '3.3 s'
+MEASUREMENT_COLUMNS = [
+    "Side Dist",
+    "Side Spin",
+    "Launch Angle",
+    "Side Angle",
+    "Decent Angle",
+    "Flight Time",
+    "Spin Axis",
+    "Face Angle",
+    "Club Path",
+    "Attack Angle",
+    "Club Lie",
+    "Impact Pos X",
+    "Impact Pos Y",
+    "Dynamic Loft",
+    "Face to Path",
+]
+
+# Direction and magnitude of a measurement; any unit suffix is ignored
+MEASUREMENT_PATTERN = r"^\s*(?P<direction>[LR])?\s*(?P<value>[-+]?\d*\.?\d+)"
+
+
+def parse_measurement(column: str) -> pl.Expr:
+    """
+    Parse a Refine measurement column into a signed float in one regex pass
+
+    Right ('R') is positive and left ('L') is negative, matching a
+    left-to-right view from behind the ball. Unparseable cells become null.
+    """
+    parts = pl.col(column).str.extract_groups(MEASUREMENT_PATTERN)
+    value = parts.struct.field("value").cast(pl.Float64, strict=False)
+    return (
+        pl.when(parts.struct.field("direction") == "L")
+          .then(-value)
+          .otherwise(value)
+          .alias(column)
+    )
@@ -0,0 +1,194 @@
+"""
+Session Cache
+Persistent Parquet cache of cleaned session data keyed by source file fingerprint,
+laid out as a Hive-partitioned dataset: sessions/club=<club>/year=<year>/<session>.parquet
+
+The manifest and summary table sit beside sessions/, so the dataset directory holds
+only partitions and reads directly with pl.scan_parquet(..., hive_partitioning=True).
+A session stays in the partition of the club it had when it was cached; club
+metadata, not the directory, says which club a session belongs to now.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Dict, Optional
+from urllib.parse import quote
+
+import polars as pl
+
+
+# Hive convention for a null partition value (sessions without a club)
+DEFAULT_PARTITION = "__HIVE_DEFAULT_PARTITION__"
+
+
+class SessionCache:
+    """Store the cleaned frame of each session CSV as Parquet so unchanged sessions skip parsing"""
+
+    def __init__(self, cache_dir: str = "data/.cache", version: int = 0):
+        """
+        Initialize cache
+
+        Args:
+            cache_dir: Directory holding the session dataset, manifest and summary table
+            version: Schema/pipeline version; entries written under another
+                     version are treated as misses
+        """
+        self.cache_dir = Path(cache_dir)
+        self.dataset_dir = self.cache_dir / "sessions"
+        self.manifest_file = self.cache_dir / "manifest.json"
+        self.summary_file = self.cache_dir / f"session_summary_v{version}.parquet"
+        self.version = version
+        self.manifest = self._load_manifest()
+        self._dirty = False
+
+    def _load_manifest(self) -> Dict:
+        """Load cache manifest from JSON file, discarding entries from other versions"""
+        if self.manifest_file.exists():
+            with open(self.manifest_file, 'r') as f:
+                manifest = json.load(f)
+            if manifest.get('version') == self.version:
+                return manifest
+        return {
+            'version': self.version,
+            'files': {}  # source file name -> fingerprint + parquet name
+        }
+
+    def save(self) -> None:
+        """Save manifest to JSON file if any entry changed"""
+        if not self._dirty:
+            return
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        with open(self.manifest_file, 'w') as f:
+            json.dump(self.manifest, f, indent=2)
+        self._dirty = False
+
+    @staticmethod
+    def content_hash(file_path: Path) -> str:
+        """SHA-256 of a file's bytes"""
+        digest = hashlib.sha256()
+        with open(file_path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def partition_path(self, session_id: str, club: Optional[str], year: int) -> Path:
+        """Path of a session's Parquet file inside the club/year partitions"""
+        club_key = quote(club, safe=" ") if club else DEFAULT_PARTITION
+        return self.dataset_dir / f"club={club_key}" / f"year={year}" / f"{session_id}.parquet"
+
+    def get(self, file_path: Path) -> Optional[Path]:
+        """
+        Get the cached Parquet file for a session CSV if it is still fresh
+
+        Size and mtime are checked first; the content hash is only computed
+        when they differ, so a touched but unchanged file stays cached. Files
+        are never moved once written, so open scans of them stay valid.
+
+        Args:
+            file_path: Session CSV
+
+        Returns:
+            Path to the Parquet file, or None on a cache miss
+        """
+        entry = self._fresh_entry(file_path)
+        return self.cache_dir / entry['parquet'] if entry else None
+
+    def fingerprint(self, file_path: Path) -> Optional[str]:
+        """Content hash of a session CSV if its cached entry is still fresh"""
+        entry = self._fresh_entry(file_path)
+        return entry['sha256'] if entry else None
+
+    def recorded_hash(self, file_path: Path) -> Optional[str]:
+        """Content hash recorded for a session CSV, without checking freshness"""
+        entry = self.manifest['files'].get(file_path.name)
+        return entry['sha256'] if entry else None
+
+    def recorded_shot_count(self, file_path: Path) -> Optional[int]:
+        """Shot count recorded when a session CSV was cached, without checking freshness"""
+        entry = self.manifest['files'].get(file_path.name)
+        return entry.get('shot_count') if entry else None
+
+    def _fresh_entry(self, file_path: Path) -> Optional[Dict]:
+        """Manifest entry for a session CSV, or None if missing or out of date"""
+        entry = self.manifest['files'].get(file_path.name)
+        if entry is None or not (self.cache_dir / entry['parquet']).exists():
+            return None
+
+        stat = file_path.stat()
+        if stat.st_size != entry['size']:
+            return None
+        if stat.st_mtime_ns != entry['mtime_ns']:
+            if self.content_hash(file_path) != entry['sha256']:
+                return None
+            entry['mtime_ns'] = stat.st_mtime_ns
+            self._dirty = True
+
+        return entry
+
+    def put(self, file_path: Path, df: pl.DataFrame, club: Optional[str], year: int) -> Path:
+        """
+        Write the cleaned frame for a session CSV and record its fingerprint
+
+        Args:
+            file_path: Session CSV
+            df: Cleaned session frame
+            club: Club assigned to the session (None = unassigned)
+            year: Session year
+
+        Returns:
+            Path to the written Parquet file
+        """
+        parquet_path = self.partition_path(file_path.stem, club, year)
+        parquet_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Write then rename so readers never see a partial file
+        tmp_path = parquet_path.with_suffix(".parquet.tmp")
+        df.write_parquet(tmp_path)
+        tmp_path.replace(parquet_path)
+
+        # Drop the previous version if the session was filed elsewhere
+        previous = self.manifest['files'].get(file_path.name)
+        if previous and self.cache_dir / previous['parquet'] != parquet_path:
+            self._remove(self.cache_dir / previous['parquet'])
+
+        stat = file_path.stat()
+        self.manifest['files'][file_path.name] = {
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+            'sha256': self.content_hash(file_path),
+            'club': club,
+            'year': year,
+            'shot_count': df.height,
+            'parquet': parquet_path.relative_to(self.cache_dir).as_posix(),
+        }
+        self._dirty = True
+        return parquet_path
+
+    def read_summary(self) -> Optional[pl.DataFrame]:
+        """Load the persisted per-session aggregate table, if any"""
+        if self.summary_file.exists():
+            return pl.read_parquet(self.summary_file)
+        return None
+
+    def write_summary(self, summary: pl.DataFrame) -> None:
+        """Persist the per-session aggregate table"""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.summary_file.with_suffix(".parquet.tmp")
+        summary.write_parquet(tmp_path)
+        tmp_path.replace(self.summary_file)
+
+    def drop_summary(self) -> None:
+        """Delete the persisted per-session aggregate table so it is rebuilt"""
+        self.summary_file.unlink(missing_ok=True)
+
+    def _remove(self, parquet_path: Path) -> None:
+        """Delete a Parquet file and any partition directories it leaves empty"""
+        parquet_path.unlink(missing_ok=True)
+        self._remove_empty_dirs(parquet_path.parent)
+
+    def _remove_empty_dirs(self, directory: Path) -> None:
+        """Remove empty partition directories up to the dataset root"""
+        while directory != self.dataset_dir and directory.is_dir() and not any(directory.iterdir()):
+            directory.rmdir()
+            directory = directory.parent
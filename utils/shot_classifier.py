@@ -0,0 +1,133 @@
+"""
+Shot Club Classifier
+Labels individual shots with their most likely club from launch monitor features,
+learned from sessions that already have a club assigned
+"""
+
+from typing import List, Optional
+
+import numpy as np
+import polars as pl
+
+
+# Per-shot features the classifier compares
+SHOT_FEATURES = ["Ball Speed", "Launch Angle", "Back Spin", "Carry", "Club Speed"]
+
+
+class ShotClubClassifier:
+    """Nearest-centroid classifier over standardized shot features"""
+
+    def __init__(self, features: Optional[List[str]] = None, min_shots: int = 5):
+        """
+        Initialize classifier
+
+        Args:
+            features: Shot columns to compare (default: SHOT_FEATURES)
+            min_shots: Clubs with fewer training shots are not learned
+        """
+        self.features = features or SHOT_FEATURES
+        self.min_shots = min_shots
+        self.clubs: List[str] = []
+        self.centroids: Optional[np.ndarray] = None  # clubs x features
+        self.scale: Optional[np.ndarray] = None  # pooled within-club std per feature
+
+    def fit(self, shots: pl.DataFrame) -> "ShotClubClassifier":
+        """
+        Learn each club's feature centroid from labeled shots
+
+        Args:
+            shots: Shots with a 'club' column and the feature columns
+
+        Returns:
+            The fitted classifier
+        """
+        stats = shots.filter(pl.col("club").is_not_null()).group_by(
+            pl.col("club").cast(pl.Utf8)
+        ).agg([
+            pl.len().alias("shots"),
+            *[pl.col(f).cast(pl.Float64).mean().alias(f"{f}_mean") for f in self.features],
+            *[pl.col(f).cast(pl.Float64).var().fill_null(0).alias(f"{f}_var") for f in self.features],
+        ]).filter(pl.col("shots") >= self.min_shots).sort("club")
+
+        if stats.height == 0:
+            raise ValueError(f"No club with at least {self.min_shots} labeled shots to learn from")
+
+        counts = stats["shots"].to_numpy().astype(float)
+        variances = stats.select([f"{f}_var" for f in self.features]).to_numpy()
+
+        self.clubs = stats["club"].to_list()
+        self.centroids = stats.select([f"{f}_mean" for f in self.features]).to_numpy()
+        # Within-club spread, so features are weighted by how tightly each club repeats them
+        pooled = ((counts[:, None] - 1) * variances).sum(axis=0) / max(counts.sum() - len(counts), 1)
+        self.scale = np.where(pooled > 0, np.sqrt(pooled), 1.0)
+        return self
+
+    def predict(self, shots: pl.DataFrame) -> pl.DataFrame:
+        """
+        Label every shot with its nearest club centroid
+
+        Missing feature values are skipped in the distance; shots with no
+        features at all get no label.
+
+        Args:
+            shots: Shots with the feature columns
+
+        Returns:
+            The shots with predicted_club, club_distance (standardized
+            distance to the centroid) and club_confidence: 0 when the two
+            nearest clubs are equally close, approaching 1 when the second is
+            much farther
+        """
+        if self.centroids is None:
+            raise ValueError("Classifier is not fitted. Call fit() first.")
+
+        X = shots.select(pl.col(self.features).cast(pl.Float64)).to_numpy()
+        Z = (X - self.centroids.mean(axis=0)) / self.scale
+        C = (self.centroids - self.centroids.mean(axis=0)) / self.scale
+
+        # Squared distance of every shot to every centroid: shots x clubs
+        d2 = np.nansum((Z[:, None, :] - C[None, :, :]) ** 2, axis=2)
+        labeled = ~np.isnan(Z).all(axis=1)
+
+        order = np.argsort(d2, axis=1)
+        best = order[:, 0]
+        nearest = np.sqrt(np.take_along_axis(d2, order[:, :1], axis=1)[:, 0])
+        if len(self.clubs) > 1:
+            second = np.sqrt(np.take_along_axis(d2, order[:, 1:2], axis=1)[:, 0])
+            confidence = np.where(second > 0, 1 - nearest / np.where(second > 0, second, 1), 0.0)
+        else:
+            confidence = np.ones(len(best))
+
+        clubs = np.array(self.clubs, dtype=object)[best]
+        return shots.with_columns([
+            pl.Series("predicted_club", np.where(labeled, clubs, None), dtype=pl.Utf8),
+            pl.Series("club_distance", np.where(labeled, nearest, np.nan)).fill_nan(None),
+            pl.Series("club_confidence", np.where(labeled, confidence, np.nan)).fill_nan(None),
+        ])
+
+    @staticmethod
+    def summarize_sessions(labeled: pl.DataFrame, min_share: float = 0.2) -> pl.DataFrame:
+        """
+        Roll shot labels up to a club suggestion per session
+
+        Args:
+            labeled: Output of predict() with a session_id column
+            min_share: Minimum share of a session's shots for a club to be
+                       listed in its club mix
+
+        Returns:
+            DataFrame with session_id, suggested_club (most frequent label),
+            share (fraction of shots with that label) and club_mix (clubs
+            with at least min_share of the shots, most frequent first)
+        """
+        counts = labeled.filter(pl.col("predicted_club").is_not_null()).group_by(
+            "session_id", "predicted_club"
+        ).agg(pl.len().alias("shots")).with_columns(
+            (pl.col("shots") / pl.col("shots").sum().over("session_id")).alias("share")
+        ).sort(["session_id", "shots", "predicted_club"], descending=[False, True, False])
+
+        return counts.group_by("session_id", maintain_order=True).agg([
+            pl.col("predicted_club").first().alias("suggested_club"),
+            pl.col("share").first(),
+            pl.col("predicted_club").filter(pl.col("share") >= min_share).alias("club_mix"),
+        ])
@@ -0,0 +1,114 @@
+"""
+Mergeable Statistical Sketches
+Per-session summaries of a shot metric that roll up to club, date-range or
+all-time statistics without rescanning shots
+"""
+
+from typing import Optional, Sequence, Union
+
+import polars as pl
+
+
+# Centroids kept per session; sessions with at most this many shots are stored exactly
+SKETCH_SIZE = 64
+
+
+def quantile_sketch(shots: pl.LazyFrame, column: str, name: str,
+                    by: str = "session_id", size: int = SKETCH_SIZE) -> pl.LazyFrame:
+    """
+    Build a quantile sketch of one metric per group
+
+    Each group's sorted values are split into at most `size` runs of equal
+    rank width; a run is kept as its mean (centroid) and its length
+    (weight). Runs never overlap, so any rank inside a run is off by less
+    than the run's weight, which bounds the error of merged quantiles.
+
+    Args:
+        shots: Shot rows
+        column: Metric to sketch (e.g., 'Carry')
+        name: Prefix for the sketch columns
+        by: Grouping column, one sketch per value
+        size: Maximum centroids per group
+
+    Returns:
+        LazyFrame with `by`, `<name>_centroids` (list[f64]) and `<name>_weights` (list[u32])
+    """
+    values = shots.select(by, pl.col(column).cast(pl.Float64)).drop_nulls(column)
+
+    runs = values.sort(by, column).with_columns(
+        (pl.int_range(pl.len()).over(by) * size // pl.len().over(by)).alias("_run")
+    ).group_by(by, "_run").agg(
+        pl.col(column).mean().alias(f"{name}_centroids"),
+        pl.len().alias(f"{name}_weights"),
+    )
+
+    return runs.sort(by, "_run").group_by(by, maintain_order=True).agg(
+        f"{name}_centroids", f"{name}_weights"
+    )
+
+
+def sketch_quantiles(sketches: Union[pl.DataFrame, pl.LazyFrame], name: str, quantiles: Sequence[float],
+                     by: Optional[str] = None) -> Union[pl.DataFrame, pl.LazyFrame]:
+    """
+    Merge quantile sketches and read quantiles from the merged sketch
+
+    Quantiles interpolate linearly between the order statistics around rank
+    q * (n - 1), like Expr.quantile(q, interpolation="linear") and
+    Expr.median(), so they are exact while the sketches hold every value.
+
+    Args:
+        sketches: Rows holding `<name>_centroids` / `<name>_weights` lists
+        name: Sketch column prefix
+        quantiles: Quantiles in [0, 1] (0.5 = median)
+        by: Merge sketches per value of this column (None = merge all rows)
+
+    Returns:
+        Frame of the same kind with one row per group: a `p<q>` column per quantile
+        (e.g., p10, p50) and `rank_error`, the largest possible error of
+        each quantile expressed as a fraction of the group's shot count
+    """
+    centroids, weights = f"{name}_centroids", f"{name}_weights"
+    keys = [by] if by else []
+    sketches = sketches.select(*keys, centroids, weights).filter(pl.col(weights).list.len() > 0)
+
+    total = pl.col(weights).sum()
+    cumulative = pl.col(weights).sort_by(centroids).cum_sum()
+
+    def order_statistic(rank: pl.Expr) -> pl.Expr:
+        """Value at a 0-based rank of the merged sketch"""
+        return pl.col(centroids).sort().filter(cumulative > rank).first()
+
+    def quantile(q: float) -> pl.Expr:
+        rank = q * (total - 1)
+        lower = order_statistic(rank.floor())
+        return lower + (rank - rank.floor()) * (order_statistic(rank.ceil()) - lower)
+
+    points = sketches.explode(centroids, weights)
+    merged = points.group_by(keys or pl.lit(0).alias("_all"), maintain_order=True).agg([
+        quantile(q).alias(f"p{q * 100:g}") for q in quantiles
+    ])
+
+    # Each session's rank uncertainty is below its widest run
+    errors = sketches.group_by(keys or pl.lit(0).alias("_all"), maintain_order=True).agg(
+        ((pl.col(weights).list.max() - 1).sum() / pl.col(weights).list.sum().sum()).alias("rank_error")
+    )
+
+    return merged.join(errors, on=keys or "_all", maintain_order="left").drop("_all", strict=False)
+
+
+def weighted_mean(value: str, weight: str) -> pl.Expr:
+    """Mean of per-group means, weighted by group size"""
+    return (pl.col(value) * pl.col(weight)).sum() / pl.col(weight).sum()
+
+
+def pooled_std(count: str, mean: str, std: str) -> pl.Expr:
+    """
+    Sample standard deviation of the union of groups from their moments
+
+    Chan's parallel combination of (count, mean, M2) triples, where each
+    group's M2 is recovered as (count - 1) * std². Exact up to float rounding.
+    """
+    n = pl.col(count)
+    m2 = (n - 1) * pl.col(std).fill_null(0) ** 2 + n * (pl.col(mean) - weighted_mean(mean, count)) ** 2
+    return (m2.sum() / (n.sum() - 1)).sqrt()
+
@@ -3,11 +3,14 @@ Golf Dashboard Visualization Utilities
 Beautiful, interactive Plotly charts for tracking golf performance
 """
 
+import functools
+import inspect
+from collections import OrderedDict
+import numpy as np
 import plotly.graph_objects as go
-import plotly.express as px
 from plotly.subplots import make_subplots
 import polars as pl
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Callable, Iterable
 
 
 # Color palette - clean, professional golf theme
@@ -35,25 +38,204 @@ BASE_LAYOUT = dict(
     height=400,
 )
 
+# Above this many shots the scatter plot renders with WebGL, binning the historical cloud
+SCATTER_WEBGL_THRESHOLD = 2000
+SCATTER_DENSITY_BINS = 40
+
+# Name tagging goal shapes, annotations and traces, and the layout meta key holding
+# what a chart needs to redraw them
+GOAL_LAYER = 'goal'
+
+# Default metrics on the performance radar
+RADAR_METRICS = [
+    'strike_quality_rate',
+    'optimal_launch_rate',
+    'quality_score',
+    'straight_rate',
+]
+
+# Summary table rows: (label, metric, unit, lower is better)
+SUMMARY_TABLE_METRICS = [
+    ('Median Carry', 'median_carry', 'yards', False),
+    ('Distance Std Dev', 'carry_std', 'yards', True),
+    ('Avg Offline', 'avg_offline', 'yards', True),
+    ('Strike Quality', 'strike_quality_rate', '%', False),
+    ('Optimal Launch', 'optimal_launch_rate', '%', False),
+    ('Quality Score', 'quality_score', '', False),
+]
+
+
+def _cache_figure(goal_keys: Optional[Callable[[dict], Iterable[str]]] = None):
+    """
+    Reuse a chart method's figure while its inputs and relevant goals are unchanged
+    
+    Args:
+        goal_keys: Maps the call's arguments to the goal names the figure
+                   depends on (None = no goals)
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            if self.cache_size <= 0:
+                return method(self, *args, **kwargs)
+            
+            bound = inspect.signature(method).bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            arguments = dict(list(bound.arguments.items())[1:])
+            goals = tuple((k, self.goals.get(k)) for k in goal_keys(arguments)) if goal_keys else ()
+            # Charts also switch goal overlays on or off with whether any goal is set
+            key = (method.__name__, *((name, _fingerprint(value)) for name, value in arguments.items()),
+                   bool(self.goals) if goals else None, goals)
+            
+            if key not in self._figures:
+                self._figures[key] = method(self, *args, **kwargs)
+                if len(self._figures) > self.cache_size:
+                    self._figures.popitem(last=False)
+            self._figures.move_to_end(key)
+            # Callers get their own copy, so changing it cannot alter the cached figure
+            return go.Figure(self._figures[key])
+        
+        return wrapper
+    
+    return decorator
+
+
+def _fingerprint(value) -> object:
+    """Hashable stand-in for a chart argument; frames hash their rows in one vectorized pass"""
+    if isinstance(value, pl.DataFrame):
+        # Each row is hashed with its position, so reordered rows change the key
+        row_hashes = value.with_row_index("__row").hash_rows()
+        return (value.height, tuple(value.columns), int(row_hashes.sum()))
+    if isinstance(value, dict):
+        return tuple(sorted((k, _fingerprint(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_fingerprint(v) for v in value)
+    return value
+
 
 class GolfVisualizer:
     """Create interactive visualizations for golf performance tracking"""
     
-    def __init__(self, goals: Optional[Dict[str, float]] = None):
+    def __init__(self, goals: Optional[Dict[str, float]] = None, cache_size: int = 32):
         """
         Initialize visualizer with optional goal targets
         
         Args:
             goals: Dictionary of metric names to goal values
                    e.g., {'carry_std': 10, 'quality_score': 0.85}
+            cache_size: Most recent figures kept for reuse when a chart is
+                        requested again with the same data and goals (0 = off).
+                        Each call returns a copy, which is safe to modify.
         """
         self.goals = goals or {}
+        self.cache_size = cache_size
+        self._figures: OrderedDict = OrderedDict()
     
+    def clear_cache(self) -> None:
+        """Drop all cached figures"""
+        self._figures.clear()
+    
+    def apply_goals(self, fig: go.Figure, goals: Optional[Dict[str, float]] = None) -> go.Figure:
+        """
+        Draw or replace the goal overlay of a chart, in place
+        
+        Only the goal shapes, annotations and the radar goal trace change, so
+        on a go.FigureWidget a goal change is sent as a small layout and
+        trace patch instead of a new figure. Figures without goal overlays
+        are returned unchanged.
+        
+        Args:
+            fig: Figure from plot_shot_scatter, plot_metric_trend or
+                 plot_performance_radar (typically built with with_goals=False)
+            goals: Goal values to draw (default: the visualizer's goals)
+            
+        Returns:
+            The same figure
+        """
+        goals = self.goals if goals is None else goals
+        meta = fig.layout.meta
+        overlay = meta.get(GOAL_LAYER) if isinstance(meta, dict) else None
+        if not overlay:
+            return fig
+        
+        shapes = [shape for shape in fig.layout.shapes if shape.name != GOAL_LAYER]
+        annotations = [note for note in fig.layout.annotations if note.name != GOAL_LAYER]
+        
+        if overlay['chart'] == 'scatter' and goals and overlay['median_carry'] is not None:
+            # Target "fairway" (e.g., ±20 yards offline, ±15 yards distance)
+            offline_goal = goals.get('max_offline', 20)
+            distance_goal = goals.get('carry_std', 15)
+            shapes.append(dict(
+                type="rect",
+                name=GOAL_LAYER,
+                x0=-offline_goal, x1=offline_goal,
+                y0=overlay['median_carry'] - distance_goal,
+                y1=overlay['median_carry'] + distance_goal,
+                line=dict(color=COLORS['goal'], width=2, dash='dash'),
+                fillcolor=COLORS['goal'],
+                opacity=0.1,
+                layer='below'
+            ))
+        
+        elif overlay['chart'] == 'trend':
+            goal_value = overlay['goal_value']
+            if goal_value is None:
+                goal_value = goals.get(overlay['metric'])
+            if goal_value is not None:
+                shapes.append(dict(
+                    type="line",
+                    name=GOAL_LAYER,
+                    xref="x domain", x0=0, x1=1,
+                    y0=goal_value, y1=goal_value,
+                    line=dict(color=COLORS['goal'], dash='dash')
+                ))
+                annotations.append(dict(
+                    name=GOAL_LAYER,
+                    text=f"Goal: {goal_value:.2f}",
+                    xref="x domain", x=1, xanchor="left",
+                    y=goal_value, showarrow=False
+                ))
+        
+        elif overlay['chart'] == 'radar':
+            self._apply_radar_goals(fig, overlay, goals)
+        
+        # Assigned rather than updated, which would merge the lists element by element
+        with fig.batch_update():
+            fig.layout.shapes = shapes
+            fig.layout.annotations = annotations
+        return fig
+    
+    @staticmethod
+    def _apply_radar_goals(fig: go.Figure, overlay: Dict, goals: Dict[str, float]) -> None:
+        """Add, update or remove the radar's goal outline trace"""
+        goal_traces = [trace for trace in fig.data if trace.meta == GOAL_LAYER]
+        
+        if not any(m in goals for m in overlay['metrics']):
+            if goal_traces:
+                fig.data = [trace for trace in fig.data if trace.meta != GOAL_LAYER]
+            return
+        
+        r = [(goals.get(m, fallback) or 0) * 100 for m, fallback in zip(overlay['metrics'], overlay['fallback'])]
+        if goal_traces:
+            goal_traces[0].r = r
+        else:
+            fig.add_trace(go.Scatterpolar(
+                r=r,
+                theta=overlay['theta'],
+                mode='lines',
+                name='Goals',
+                meta=GOAL_LAYER,
+                line=dict(color=COLORS['goal'], width=2, dash='dash')
+            ))
+    
+    @_cache_figure(lambda args: ['max_offline', 'carry_std'] if args['with_goals'] else [])
     def plot_shot_scatter(
         self, 
         shot_data: pl.DataFrame,
         current_session_id: Optional[str] = None,
-        title: str = "Shot Dispersion Pattern"
+        title: str = "Shot Dispersion Pattern",
+        render_mode: str = "auto",
+        with_goals: bool = True
     ) -> go.Figure:
         """
         Create scatter plot of shot landing positions
@@ -62,69 +244,131 @@ class GolfVisualizer:
             shot_data: DataFrame with Carry and side_dist_signed columns
             current_session_id: Highlight specific session
             title: Chart title
+            render_mode: 'svg', 'webgl' (Scattergl markers), 'density' (historical
+                         shots binned into a 2D histogram, current session as
+                         points) or 'auto' (svg up to SCATTER_WEBGL_THRESHOLD
+                         shots, then density when a session is highlighted and
+                         webgl otherwise)
+            with_goals: If False, return the data layers only; add the target
+                        area later with apply_goals()
         """
-        # Convert to pandas for Plotly Express
-        df = shot_data.to_pandas()
+        if with_goals:
+            base = self.plot_shot_scatter(shot_data, current_session_id, title, render_mode, with_goals=False)
+            return self.apply_goals(base)
+        
+        if render_mode == "auto":
+            if shot_data.height <= SCATTER_WEBGL_THRESHOLD:
+                render_mode = "svg"
+            else:
+                render_mode = "density" if current_session_id else "webgl"
         
         # Determine color coding
         if current_session_id:
-            df['session_type'] = df['session_id'].apply(
-                lambda x: 'Current' if x == current_session_id else 'Historical'
+            df = shot_data.with_columns(
+                pl.when(pl.col('session_id').cast(pl.Utf8) == current_session_id)
+                  .then(pl.lit('Current'))
+                  .otherwise(pl.lit('Historical'))
+                  .alias('session_type')
             )
+            groups = ['Current', 'Historical']
             color_col = 'session_type'
             color_map = {'Current': COLORS['accent'], 'Historical': COLORS['neutral']}
+        elif render_mode == "density":
+            # Nothing highlighted, so every shot goes into one density layer
+            df = shot_data.with_columns(pl.lit('All Sessions').alias('Shots'))
+            groups = ['All Sessions']
+            color_col = 'Shots'
+            color_map = {}
         else:
+            df = shot_data.with_columns(pl.col('Type').cast(pl.Utf8).fill_null('Unknown'))
+            groups = df['Type'].unique(maintain_order=True).to_list()
             color_col = 'Type'
-            color_map = None
-        
-        fig = px.scatter(
-            df,
-            x='side_dist_signed',
-            y='Carry',
-            color=color_col,
-            color_discrete_map=color_map,
-            hover_data=['Ball Speed', 'Launch Angle', 'session_id'],
-            title=title,
-            labels={
-                'side_dist_signed': 'Lateral Distance (yards)',
-                'Carry': 'Carry Distance (yards)'
-            }
-        )
+            color_map = {}
         
-        # Add target circle (e.g., ±20 yards offline, ±15 yards distance)
-        if self.goals:
-            offline_goal = self.goals.get('max_offline', 20)
-            distance_goal = self.goals.get('carry_std', 15)
+        fig = go.Figure()
+        scatter = go.Scattergl if render_mode in ("webgl", "density") else go.Scatter
+        
+        for group in groups:
+            points = df.filter(pl.col(color_col) == group)
+            if points.height == 0:
+                continue
             
-            # Add rectangle for "fairway"
-            fig.add_shape(
-                type="rect",
-                x0=-offline_goal, x1=offline_goal,
-                y0=df['Carry'].median() - distance_goal,
-                y1=df['Carry'].median() + distance_goal,
-                line=dict(color=COLORS['goal'], width=2, dash='dash'),
-                fillcolor=COLORS['goal'],
-                opacity=0.1,
-                layer='below'
-            )
+            if render_mode == "density" and group != 'Current':
+                fig.add_trace(self._density_layer(points, name=group))
+                continue
+            
+            fig.add_trace(scatter(
+                x=points['side_dist_signed'].to_numpy(),
+                y=points['Carry'].to_numpy(),
+                mode='markers',
+                name=group,
+                marker=dict(color=color_map.get(group)),
+                customdata=points.select(
+                    pl.col('Ball Speed', 'Launch Angle').cast(pl.Float64),
+                    pl.col('session_id').cast(pl.Utf8)
+                ).to_numpy(),
+                hovertemplate=(
+                    'Lateral: %{x:.1f} yds<br>Carry: %{y:.1f} yds<br>'
+                    'Ball Speed: %{customdata[0]:.1f}<br>Launch Angle: %{customdata[1]:.1f}<br>'
+                    '%{customdata[2]}<extra>' + group + '</extra>'
+                )
+            ))
         
         # Add centerline
         fig.add_hline(y=0, line_dash="dot", line_color=COLORS['neutral'], opacity=0.5)
         fig.add_vline(x=0, line_dash="dot", line_color=COLORS['neutral'], opacity=0.5)
         
-        fig.update_layout(**BASE_LAYOUT, height=500)
-        fig.update_xaxis(zeroline=True, zerolinewidth=1, zerolinecolor=COLORS['neutral'])
-        fig.update_yaxis(zeroline=False)
+        fig.update_layout(
+            **{**BASE_LAYOUT, 'height': 500},
+            title=title,
+            template=CHART_TEMPLATE,
+            xaxis_title='Lateral Distance (yards)',
+            yaxis_title='Carry Distance (yards)',
+            legend_title_text=color_col,
+            meta={GOAL_LAYER: {'chart': 'scatter', 'median_carry': shot_data['Carry'].median()}},
+        )
+        fig.update_xaxes(zeroline=True, zerolinewidth=1, zerolinecolor=COLORS['neutral'])
+        fig.update_yaxes(zeroline=False)
         
         return fig
     
+    @staticmethod
+    def _density_layer(shots: pl.DataFrame, name: str, bins: int = SCATTER_DENSITY_BINS) -> go.Heatmap:
+        """
+        Bin shot landing positions into a 2D histogram layer
+        
+        Args:
+            shots: DataFrame with Carry and side_dist_signed columns
+            name: Legend name for the layer
+            bins: Bins per axis
+        """
+        points = shots.select(
+            pl.col('side_dist_signed', 'Carry').cast(pl.Float64)
+        ).drop_nulls().to_numpy()
+        
+        counts, x_edges, y_edges = np.histogram2d(points[:, 0], points[:, 1], bins=bins)
+        
+        return go.Heatmap(
+            x=(x_edges[:-1] + x_edges[1:]) / 2,
+            y=(y_edges[:-1] + y_edges[1:]) / 2,
+            # Empty bins stay transparent
+            z=np.where(counts.T > 0, counts.T, np.nan),
+            name=name,
+            colorscale=[[0, 'rgba(117,117,117,0.15)'], [1, 'rgba(117,117,117,0.9)']],
+            showscale=False,
+            showlegend=True,
+            hovertemplate='Lateral: %{x:.1f} yds<br>Carry: %{y:.1f} yds<br>Shots: %{z}<extra>' + name + '</extra>'
+        )
+    
+    @_cache_figure(lambda args: [args['metric']] if args['with_goals'] else [])
     def plot_metric_trend(
         self,
         trend_data: pl.DataFrame,
         metric: str,
         metric_label: str,
         lower_is_better: bool = False,
-        goal_value: Optional[float] = None
+        goal_value: Optional[float] = None,
+        with_goals: bool = True
     ) -> go.Figure:
         """
         Create time series trend chart with rolling average
@@ -134,16 +378,25 @@ class GolfVisualizer:
             metric: Column name to plot
             metric_label: Display label for metric
             lower_is_better: Whether lower values are better
-            goal_value: Target value to display as reference line
+            goal_value: Target value to display as reference line (overrides
+                        the metric's goal)
+            with_goals: If False, return the data traces only; add the goal
+                        line later with apply_goals()
         """
-        df = trend_data.to_pandas()
+        if with_goals:
+            base = self.plot_metric_trend(
+                trend_data, metric, metric_label, lower_is_better, goal_value, with_goals=False
+            )
+            return self.apply_goals(base)
+        
+        dates = trend_data['session_date'].to_numpy()
         
         fig = go.Figure()
         
         # Individual session values
         fig.add_trace(go.Scatter(
-            x=df['session_date'],
-            y=df[metric],
+            x=dates,
+            y=trend_data[metric].to_numpy(),
             mode='markers',
             name='Session',
             marker=dict(size=10, color=COLORS['secondary'], opacity=0.6),
@@ -151,51 +404,35 @@ class GolfVisualizer:
         ))
         
         # Trend line
-        if f"{metric}_trend" in df.columns:
+        if f"{metric}_trend" in trend_data.columns:
             fig.add_trace(go.Scatter(
-                x=df['session_date'],
-                y=df[f"{metric}_trend"],
+                x=dates,
+                y=trend_data[f"{metric}_trend"].to_numpy(),
                 mode='lines',
                 name='Trend (3-session avg)',
                 line=dict(color=COLORS['primary'], width=3),
                 hovertemplate='<b>%{x|%b %d}</b><br>Trend: %{y:.2f}<extra></extra>'
             ))
         
-        # Goal line
-        if goal_value is not None:
-            fig.add_hline(
-                y=goal_value,
-                line_dash="dash",
-                line_color=COLORS['goal'],
-                annotation_text=f"Goal: {goal_value:.2f}",
-                annotation_position="right"
-            )
-        elif metric in self.goals:
-            goal_val = self.goals[metric]
-            fig.add_hline(
-                y=goal_val,
-                line_dash="dash",
-                line_color=COLORS['goal'],
-                annotation_text=f"Goal: {goal_val:.2f}",
-                annotation_position="right"
-            )
-        
         fig.update_layout(
             **BASE_LAYOUT,
             title=f"{metric_label} Over Time",
             xaxis_title="Session Date",
             yaxis_title=metric_label,
             showlegend=True,
-            legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
+            legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+            meta={GOAL_LAYER: {'chart': 'trend', 'metric': metric, 'goal_value': goal_value}},
         )
         
         return fig
     
+    @_cache_figure(lambda args: (args['metrics'] or RADAR_METRICS) if args['with_goals'] else [])
     def plot_performance_radar(
         self,
         current_stats: pl.DataFrame,
         historical_avg: pl.DataFrame,
-        metrics: List[str] = None
+        metrics: List[str] = None,
+        with_goals: bool = True
     ) -> go.Figure:
         """
         Create radar chart comparing current session to historical average
@@ -204,14 +441,15 @@ class GolfVisualizer:
             current_stats: Current session summary stats
             historical_avg: Average of all historical sessions
             metrics: List of metrics to include (uses defaults if None)
+            with_goals: If False, return the data traces only; add the goal
+                        outline later with apply_goals()
         """
+        if with_goals:
+            base = self.plot_performance_radar(current_stats, historical_avg, metrics, with_goals=False)
+            return self.apply_goals(base)
+        
         if metrics is None:
-            metrics = [
-                'strike_quality_rate',
-                'optimal_launch_rate', 
-                'quality_score',
-                'straight_rate'
-            ]
+            metrics = RADAR_METRICS
         
         labels = {
             'strike_quality_rate': 'Strike Quality',
@@ -225,20 +463,21 @@ class GolfVisualizer:
         
         fig = go.Figure()
         
-        # Historical average
-        fig.add_trace(go.Scatterpolar(
-            r=[historical.get(m, 0) * 100 for m in metrics],
-            theta=[labels.get(m, m) for m in metrics],
-            fill='toself',
-            name='Historical Avg',
-            line_color=COLORS['neutral'],
-            fillcolor=COLORS['neutral'],
-            opacity=0.3
-        ))
+        # Historical average (null when there is no earlier session)
+        if any(historical.get(m) is not None for m in metrics):
+            fig.add_trace(go.Scatterpolar(
+                r=[(historical.get(m) or 0) * 100 for m in metrics],
+                theta=[labels.get(m, m) for m in metrics],
+                fill='toself',
+                name='Historical Avg',
+                line_color=COLORS['neutral'],
+                fillcolor=COLORS['neutral'],
+                opacity=0.3
+            ))
         
         # Current session
         fig.add_trace(go.Scatterpolar(
-            r=[current.get(m, 0) * 100 for m in metrics],
+            r=[(current.get(m) or 0) * 100 for m in metrics],
             theta=[labels.get(m, m) for m in metrics],
             fill='toself',
             name='Current Session',
@@ -247,30 +486,26 @@ class GolfVisualizer:
             opacity=0.5
         ))
         
-        # Goals
-        if any(m in self.goals for m in metrics):
-            goal_values = [self.goals.get(m, historical.get(m, 0)) * 100 for m in metrics]
-            fig.add_trace(go.Scatterpolar(
-                r=goal_values,
-                theta=[labels.get(m, m) for m in metrics],
-                mode='lines',
-                name='Goals',
-                line=dict(color=COLORS['goal'], width=2, dash='dash')
-            ))
-        
         fig.update_layout(
-            **BASE_LAYOUT,
+            **{**BASE_LAYOUT, 'height': 450},
             polar=dict(
                 radialaxis=dict(visible=True, range=[0, 100], showticklabels=True),
                 angularaxis=dict(direction="clockwise")
             ),
             showlegend=True,
             title="Performance Comparison",
-            height=450
+            meta={GOAL_LAYER: {
+                'chart': 'radar',
+                'metrics': metrics,
+                'theta': [labels.get(m, m) for m in metrics],
+                # Metrics without a goal are drawn at their historical average
+                'fallback': [historical.get(m) or 0 for m in metrics],
+            }},
         )
         
         return fig
     
+    @_cache_figure()
     def plot_consistency_dashboard(
         self,
         summary: pl.DataFrame,
@@ -283,8 +518,10 @@ class GolfVisualizer:
             summary: Session summary DataFrame
             current_session_id: ID of current session to highlight
         """
-        df = summary.to_pandas()
-        current_idx = df[df['session_id'] == current_session_id].index[0] if current_session_id in df['session_id'].values else -1
+        dates = summary['session_date'].to_numpy()
+        is_current = (summary['session_id'] == current_session_id).to_numpy()
+        spread_colors = np.where(is_current, COLORS['accent'], COLORS['secondary'])
+        rate_colors = np.where(is_current, COLORS['accent'], COLORS['positive'])
         
         # Create 2x2 subplot grid
         fig = make_subplots(
@@ -302,9 +539,9 @@ class GolfVisualizer:
         # Distance consistency (lower is better)
         fig.add_trace(
             go.Bar(
-                x=df['session_date'],
-                y=df['carry_std'],
-                marker_color=[COLORS['accent'] if i == current_idx else COLORS['secondary'] for i in range(len(df))],
+                x=dates,
+                y=summary['carry_std'].to_numpy(),
+                marker_color=spread_colors,
                 showlegend=False,
                 hovertemplate='%{x|%b %d}<br>Std Dev: %{y:.1f} yds<extra></extra>'
             ),
@@ -314,9 +551,9 @@ class GolfVisualizer:
         # Directional control (lower is better)
         fig.add_trace(
             go.Bar(
-                x=df['session_date'],
-                y=df['directional_std'],
-                marker_color=[COLORS['accent'] if i == current_idx else COLORS['secondary'] for i in range(len(df))],
+                x=dates,
+                y=summary['directional_std'].to_numpy(),
+                marker_color=spread_colors,
                 showlegend=False,
                 hovertemplate='%{x|%b %d}<br>Std Dev: %{y:.1f} yds<extra></extra>'
             ),
@@ -326,9 +563,9 @@ class GolfVisualizer:
         # Strike quality (higher is better)
         fig.add_trace(
             go.Bar(
-                x=df['session_date'],
-                y=df['strike_quality_rate'] * 100,
-                marker_color=[COLORS['accent'] if i == current_idx else COLORS['positive'] for i in range(len(df))],
+                x=dates,
+                y=(summary['strike_quality_rate'] * 100).to_numpy(),
+                marker_color=rate_colors,
                 showlegend=False,
                 hovertemplate='%{x|%b %d}<br>Quality: %{y:.1f}%<extra></extra>'
             ),
@@ -338,9 +575,9 @@ class GolfVisualizer:
         # Shot shape (higher is better)
         fig.add_trace(
             go.Bar(
-                x=df['session_date'],
-                y=df['straight_rate'] * 100,
-                marker_color=[COLORS['accent'] if i == current_idx else COLORS['positive'] for i in range(len(df))],
+                x=dates,
+                y=(summary['straight_rate'] * 100).to_numpy(),
+                marker_color=rate_colors,
                 showlegend=False,
                 hovertemplate='%{x|%b %d}<br>Straight: %{y:.1f}%<extra></extra>'
             ),
@@ -366,6 +603,7 @@ class GolfVisualizer:
         
         return fig
     
+    @_cache_figure(lambda args: [] if args['goals'] else [key for _, key, _, _ in SUMMARY_TABLE_METRICS])
     def create_summary_table(
         self,
         current: pl.DataFrame,
@@ -377,7 +615,7 @@ class GolfVisualizer:
         
         Args:
             current: Current session stats
-            historical: Historical average stats
+            historical: Historical average stats (null = no earlier sessions)
             goals: Goal values for each metric
         """
         goals = goals or self.goals
@@ -385,17 +623,8 @@ class GolfVisualizer:
         curr_dict = current.to_dicts()[0]
         hist_dict = historical.to_dicts()[0]
         
-        metrics = [
-            ('Median Carry', 'median_carry', 'yards', False),
-            ('Distance Std Dev', 'carry_std', 'yards', True),
-            ('Avg Offline', 'avg_offline', 'yards', True),
-            ('Strike Quality', 'strike_quality_rate', '%', False),
-            ('Optimal Launch', 'optimal_launch_rate', '%', False),
-            ('Quality Score', 'quality_score', '', False),
-        ]
-        
         rows = []
-        for label, key, unit, lower_better in metrics:
+        for label, key, unit, lower_better in SUMMARY_TABLE_METRICS:
             curr_val = curr_dict.get(key, 0)
             hist_val = hist_dict.get(key, 0)
             goal_val = goals.get(key, None)
@@ -403,19 +632,21 @@ class GolfVisualizer:
             # Format values
             if unit == '%':
                 curr_str = f"{curr_val*100:.1f}%"
-                hist_str = f"{hist_val*100:.1f}%"
+                hist_str = f"{hist_val*100:.1f}%" if hist_val is not None else "--"
                 goal_str = f"{goal_val*100:.1f}%" if goal_val else "--"
             elif unit == '':
                 curr_str = f"{curr_val:.3f}"
-                hist_str = f"{hist_val:.3f}"
+                hist_str = f"{hist_val:.3f}" if hist_val is not None else "--"
                 goal_str = f"{goal_val:.3f}" if goal_val else "--"
             else:
                 curr_str = f"{curr_val:.1f}"
-                hist_str = f"{hist_val:.1f}"
+                hist_str = f"{hist_val:.1f}" if hist_val is not None else "--"
                 goal_str = f"{goal_val:.1f}" if goal_val else "--"
             
-            # Determine if improving
-            if lower_better:
+            # Determine if improving (no history means nothing to compare)
+            if hist_val is None:
+                improving = False
+            elif lower_better:
                 improving = curr_val < hist_val
             else:
                 improving = curr_val > hist_val
@@ -449,6 +680,7 @@ class GolfVisualizer:
         
         return fig
     
+    @_cache_figure()
     def plot_club_comparison(self, club_comparison: pl.DataFrame) -> go.Figure:
         """
         Create comparison chart showing performance across different clubs
@@ -459,9 +691,7 @@ class GolfVisualizer:
         Returns:
             Plotly figure with club comparison
         """
-        df = club_comparison.to_pandas()
-        
-        if len(df) == 0:
+        if club_comparison.height == 0:
             # Return empty figure with message
             fig = go.Figure()
             fig.add_annotation(
@@ -470,9 +700,11 @@ class GolfVisualizer:
                 x=0.5, y=0.5, showarrow=False,
                 font=dict(size=14, color=COLORS['neutral'])
             )
-            fig.update_layout(**BASE_LAYOUT, height=400)
+            fig.update_layout(**BASE_LAYOUT)
             return fig
         
+        clubs = club_comparison['club'].cast(pl.Utf8).to_numpy()
+        
         # Create subplots: Distance and Consistency
         fig = make_subplots(
             rows=1, cols=2,
@@ -483,14 +715,14 @@ class GolfVisualizer:
         # Distance chart
         fig.add_trace(
             go.Bar(
-                x=df['club'],
-                y=df['median_carry'],
+                x=clubs,
+                y=club_comparison['median_carry'].to_numpy(),
                 name='Median Carry',
                 marker_color=COLORS['primary'],
-                text=df['median_carry'].round(1),
+                text=club_comparison['median_carry'].round(1).to_numpy(),
                 textposition='outside',
                 hovertemplate='<b>%{x}</b><br>Carry: %{y:.1f} yds<br>Sessions: %{customdata}<extra></extra>',
-                customdata=df['num_sessions']
+                customdata=club_comparison['num_sessions'].to_numpy()
             ),
             row=1, col=1
         )
@@ -498,14 +730,14 @@ class GolfVisualizer:
         # Consistency chart (lower is better, so invert for visual)
         fig.add_trace(
             go.Bar(
-                x=df['club'],
-                y=df['carry_std'],
+                x=clubs,
+                y=club_comparison['carry_std'].to_numpy(),
                 name='Distance Std Dev',
                 marker_color=COLORS['secondary'],
-                text=df['carry_std'].round(1),
+                text=club_comparison['carry_std'].round(1).to_numpy(),
                 textposition='outside',
                 hovertemplate='<b>%{x}</b><br>Std Dev: %{y:.1f} yds<br>Total Shots: %{customdata}<extra></extra>',
-                customdata=df['total_shots']
+                customdata=club_comparison['total_shots'].to_numpy()
             ),
             row=1, col=2
         )